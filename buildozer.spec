@@ -18,7 +18,7 @@ source.include_exts = py,png,jpg,kv,atlas
 # (list) Source files to exclude (let empty to not exclude anything)
 #source.exclude_exts = spec
 
-source.exclude_dirs = tests, bin, venv
+source.exclude_dirs = tests, bin, venv, tools
 
 version = 1.0
 
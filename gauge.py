@@ -1,10 +1,10 @@
 from kivy.animation import Animation
-from kivy.graphics import Color, Line, Ellipse, PushMatrix, PopMatrix, Rotate, Translate
+from kivy.graphics import Color, Ellipse, Mesh
 from kivy.metrics import dp
 from kivy.properties import NumericProperty, StringProperty, ListProperty, BooleanProperty
 from kivy.uix.label import Label
 from kivy.uix.widget import Widget
-from math import radians, sin, cos
+from math import radians, sin, cos, pi
 
 from colors import (
     BG_HALO,
@@ -16,9 +16,100 @@ from colors import (
     PROGRESS_WARN,
     PROGRESS_BAD,
 )
+from glyphs import GlyphLabel
+from lifecycle import lifecycle
+from performance import profile
+from redraw import CoalescedRedrawMixin
 
+# Arc angles follow Line(circle=...): 0° at 12 o'clock, clockwise.
+ARC_START = -210
+ARC_END = 30
+ARC_SPAN = ARC_END - ARC_START  # 240°
+ARC_STEPS = ARC_SPAN  # one segment per degree
+# progress segments drawn by the static mesh in whole chunks; the rest is the small tail mesh
+PROGRESS_CHUNK = 10
+DISC_STEPS = 12
 
-class Gauge(Widget):
+# Precomputed unit-circle tables, shared by every gauge
+ARC_UNIT = [
+    (sin(radians(ARC_START + ARC_SPAN * i / ARC_STEPS)), cos(radians(ARC_START + ARC_SPAN * i / ARC_STEPS)))
+    for i in range(ARC_STEPS + 1)
+]
+# ticks and needle use the standard (counter-clockwise from 3 o'clock) convention
+TICK_UNIT = [
+    (i, cos(radians(ARC_START + ARC_SPAN * i / 100.0)), sin(radians(ARC_START + ARC_SPAN * i / 100.0)))
+    for i in range(0, 101, 10)
+]
+DISC_UNIT = [(cos(2 * pi * i / DISC_STEPS), sin(2 * pi * i / DISC_STEPS)) for i in range(DISC_STEPS)]
+
+# Mesh vertices are (x, y, u, v); the gauge is untextured so u, v stay 0.
+DISC_VERTS = DISC_STEPS + 1
+DISC_INDICES = [j for i in range(DISC_STEPS) for j in (0, 1 + i, 1 + (i + 1) % DISC_STEPS)]
+ARC_INDICES = [
+    j for i in range(ARC_STEPS)
+    for j in (2 * i, 2 * i + 1, 2 * i + 2, 2 * i + 1, 2 * i + 3, 2 * i + 2)
+]
+
+
+def arc_vertices(cx: float, cy: float, r: float, half_width: float) -> list[float]:
+    """Outer/inner vertex pairs along the full arc."""
+    ro, ri = r + half_width, r - half_width
+    verts = []
+    for ux, uy in ARC_UNIT:
+        verts.extend((cx + ro * ux, cy + ro * uy, 0, 0, cx + ri * ux, cy + ri * uy, 0, 0))
+    return verts
+
+
+def disc_vertices(cx: float, cy: float, radius: float) -> list[float]:
+    """Triangle-fan disc, used for round caps."""
+    verts = [cx, cy, 0, 0]
+    for ux, uy in DISC_UNIT:
+        verts.extend((cx + radius * ux, cy + radius * uy, 0, 0))
+    return verts
+
+
+def segment_vertices(x1: float, y1: float, x2: float, y2: float, half_width: float) -> list[float]:
+    """Quad covering a straight segment of the given half width."""
+    dx, dy = x2 - x1, y2 - y1
+    length = (dx * dx + dy * dy) ** 0.5 or 1.0
+    nx, ny = -dy / length * half_width, dx / length * half_width
+    return [
+        x1 + nx, y1 + ny, 0, 0,
+        x1 - nx, y1 - ny, 0, 0,
+        x2 + nx, y2 + ny, 0, 0,
+        x2 - nx, y2 - ny, 0, 0,
+    ]
+
+
+def offset_indices(indices: list[int], offset: int) -> list[int]:
+    return [i + offset for i in indices]
+
+
+ARC_VERTS = 2 * (ARC_STEPS + 1)
+SEGMENT_INDICES = [0, 1, 2, 1, 3, 2]
+# arc followed by a cap disc at each end
+TRACK_INDICES = ARC_INDICES + offset_indices(DISC_INDICES, ARC_VERTS) + offset_indices(DISC_INDICES, ARC_VERTS + DISC_VERTS)
+# start cap of the static progress mesh, after the full arc
+START_CAP_INDICES = offset_indices(DISC_INDICES, ARC_VERTS)
+# segment followed by a cap disc at each end
+NEEDLE_INDICES = SEGMENT_INDICES + offset_indices(DISC_INDICES, 4) + offset_indices(DISC_INDICES, 4 + DISC_VERTS)
+TICK_INDICES = [j + 4 * k for k in range(len(TICK_UNIT)) for j in SEGMENT_INDICES]
+
+
+def progress_color_for(value: float, reverse_color_logic: bool = False):
+    """Target progress color for a 0–100 value."""
+    if not reverse_color_logic:
+        # cpu, mem
+        if value < 50:
+            return PROGRESS_GOOD
+        if value < 80:
+            return PROGRESS_WARN
+        return PROGRESS_BAD
+    # battery etc
+    return PROGRESS_BAD if value < 15 else PROGRESS_GOOD
+
+
+class Gauge(CoalescedRedrawMixin, Widget):
     """
     A sleek, responsive radial gauge for 0–100 values with a wow look.
 
@@ -37,34 +128,61 @@ class Gauge(Widget):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.value_label = Label(text="0%", color=(1, 1, 1, 1))
+        self.value_label = GlyphLabel(text="0%", color=(1, 1, 1, 1))
         self.title_label = Label(text=self.label, color=(0.8, 0.85, 0.9, 1))
         self.add_widget(self.value_label)
         self.add_widget(self.title_label)
-        self.bind(pos=self._update, size=self._update, value=self._update, label=self._update)
-
-    def __animate_color(self, value: float) -> None:
-        """Animate progress color based on the current value."""
-        if not self.reverse_color_logic:
-            # cpu, mem
-            if value < 50:
-                target_color = PROGRESS_GOOD
-            elif value < 80:
-                target_color = PROGRESS_WARN
-            else:
-                target_color = PROGRESS_BAD
-        else:
-            # battery etc
-            target_color = PROGRESS_BAD if value < 15 else PROGRESS_GOOD
+        # one Color + Mesh per layer; Line tessellation is replaced by
+        # vertex buffers rebuilt from the unit-circle tables above
+        with self.canvas.before:
+            self._halo = None
+            if profile.gauge_halo:
+                Color(*BG_HALO)
+                self._halo = Ellipse(size=(0, 0))
+            self._track_color = Color(*self.track_color)
+            self._track_mesh = Mesh(mode="triangles")
+            self._progress_color = Color(*self.progress_color)
+            self._progress_mesh = Mesh(mode="triangles")
+            self._progress_tail_mesh = Mesh(mode="triangles")
+            Color(*GAUGE_TICKS)
+            self._tick_mesh = Mesh(mode="triangles")
+            self._accent_color = Color(*self.accent_color)
+            self._needle_mesh = Mesh(mode="triangles")
+        self._progress_arc = []
+        self._progress_chunks = None
+        # layout passes and animation steps only mark parts dirty; one redraw per frame
+        self.bind_redraw("geometry", "pos", "size")
+        self.bind_redraw("value", "value")
+        self.bind_redraw("label", "label")
+        self.mark_dirty("geometry")
+        self.bind(
+            track_color=lambda *_: setattr(self._track_color, "rgba", self.track_color),
+            progress_color=lambda *_: setattr(self._progress_color, "rgba", self.progress_color),
+            accent_color=lambda *_: setattr(self._accent_color, "rgba", self.accent_color),
+        )
+        lifecycle.add_listener(on_pause=self._on_lifecycle_pause)
+
+    def _on_lifecycle_pause(self) -> None:
+        # nothing is on screen; the catch-up fetch on resume re-animates
+        Animation.cancel_all(self)
+
+    def __animate_color(self, target_color) -> None:
+        """Animate progress color towards ``target_color``."""
         Animation.cancel_all(self, "progress_color")
         Animation(progress_color=target_color, duration=0.5, t="in_out_cubic").start(self)
 
-    def animate_to(self, new_value: float, duration: float = 0.5) -> None:
+    def animate_to(self, new_value: float, duration: float = 0.5, color=None) -> None:
+        """
+        Animate to ``new_value``; ``color`` is the precomputed target progress
+        color, derived from the value when not given.
+        """
         new_value = max(0.0, min(100.0, float(new_value or 0.0)))
         Animation.cancel_all(self)
         anim = Animation(value=new_value, duration=duration, t="out_quad")
         anim.start(self)
-        self.__animate_color(new_value)
+        if color is None:
+            color = progress_color_for(new_value, self.reverse_color_logic)
+        self.__animate_color(color)
 
     @property
     def _radius(self) -> float:
@@ -77,61 +195,109 @@ class Gauge(Widget):
         v = max(min(value, a2), a1)
         return b1 + (b2 - b1) * ((v - a1) / (a2 - a1) if a2 != a1 else 0)
 
-    def _update(self, *args) -> None:
-        self.canvas.before.clear()
-
-        # Angles for the arc
-        start_angle = -210
-        end_angle = 30
-        span = end_angle - start_angle  # 240°
-        val_angle = start_angle + (span * max(0.0, min(1.0, self.value / 100.0)))
+    def redraw(self, parts: set) -> None:
+        if "geometry" in parts:
+            # also refreshes the value and label
+            self._update()
+            return
+        if "value" in parts:
+            self._update_value()
+        if "label" in parts:
+            self._update_label()
 
+    def _update(self, *args) -> None:
+        """Rebuild the geometry that depends on position and size."""
         cx, cy = self.center
         r = self._radius
         pad10 = dp(10)
-        track_width = max(2.0, self.width * 0.03)
-        progress_width = max(2.0, self.width * 0.04)
+        track_hw = max(2.0, self.width * 0.03)
+        progress_hw = max(2.0, self.width * 0.04)
 
-        with self.canvas.before:
-            # subtle outer halo
-            Color(*BG_HALO)
-            Ellipse(pos=(cx - r - pad10, cy - r - pad10), size=(2 * (r + pad10), 2 * (r + pad10)))
+        # subtle outer halo
+        if self._halo is not None:
+            self._halo.pos = (cx - r - pad10, cy - r - pad10)
+            self._halo.size = (2 * (r + pad10), 2 * (r + pad10))
 
-            # background track
-            Color(*self.track_color)
-            Line(circle=(cx, cy, r, start_angle, end_angle), width=track_width, cap="round")
+        # background track with round caps
+        first_ux, first_uy = ARC_UNIT[0]
+        last_ux, last_uy = ARC_UNIT[-1]
+        self._track_mesh.vertices = (
+            arc_vertices(cx, cy, r, track_hw)
+            + disc_vertices(cx + r * first_ux, cy + r * first_uy, track_hw)
+            + disc_vertices(cx + r * last_ux, cy + r * last_uy, track_hw)
+        )
+        self._track_mesh.indices = TRACK_INDICES
 
-            # progress track (gradient-like with two passes)
-            Color(*self.progress_color)
-            Line(circle=(cx, cy, r, start_angle, val_angle), width=progress_width, cap="round")
+        # progress: the full arc and start cap are uploaded here only; a value
+        # change re-indexes this mesh when it crosses a chunk boundary and
+        # otherwise rewrites just the small tail mesh
+        self._progress_arc = arc_vertices(cx, cy, r, progress_hw)
+        self._progress_mesh.vertices = self._progress_arc + disc_vertices(
+            cx + r * first_ux, cy + r * first_uy, progress_hw
+        )
+        self._progress_chunks = None
 
-            # ticks
-            Color(*GAUGE_TICKS)
-            for i in range(0, 101, 10):
-                ang = radians(start_angle + (span * (i / 100.0)))
-                outer = r + dp(2)
-                inner = outer - (dp(10) if i % 20 == 0 else dp(6))
-                x1 = cx + outer * cos(ang)
-                y1 = cy + outer * sin(ang)
-                x2 = cx + inner * cos(ang)
-                y2 = cy + inner * sin(ang)
-                Line(points=[x1, y1, x2, y2], width=1)
-
-            # needle
-            Color(*self.accent_color)
-            PushMatrix()
-            Translate(cx, cy)
-            Rotate(angle=val_angle)
-            Line(points=[0, 0, r * 0.85, 0], width=dp(2))
-            PopMatrix()
+        # ticks
+        tick_verts = []
+        outer = r + dp(2)
+        for i, ux, uy in TICK_UNIT:
+            inner = outer - (dp(10) if i % 20 == 0 else dp(6))
+            tick_verts += segment_vertices(cx + outer * ux, cy + outer * uy, cx + inner * ux, cy + inner * uy, 1)
+        self._tick_mesh.vertices = tick_verts
+        self._tick_mesh.indices = TICK_INDICES
 
         # Center labels
-        self.value_label.text = f"{int(self.value)}%"
-        self.title_label.text = self.label
-        # Positioning
         self.value_label.center_x = cx
         self.value_label.center_y = cy + r * 0.15
         self.value_label.font_size = max(dp(12), self.width * 0.09)
         self.title_label.center_x = cx
         self.title_label.center_y = cy - r * 0.35
         self.title_label.font_size = max(dp(10), self.width * 0.06)
+        self._update_label()
+        self._update_value()
+
+    def _update_label(self, *args) -> None:
+        self.title_label.text = self.label
+
+    def _update_value(self, *args) -> None:
+        """Move the progress end, the needle and the value text."""
+        if not self._progress_arc:
+            return
+        cx, cy = self.center
+        r = self._radius
+        progress_hw = max(2.0, self.width * 0.04)
+        frac = max(0.0, min(1.0, self.value / 100.0))
+        val_angle = ARC_START + ARC_SPAN * frac
+
+        # progress arc: whole chunks from the static mesh, then a tail mesh with
+        # the remaining whole segments, a quad to the exact angle and the end cap
+        steps = int(frac * ARC_STEPS)
+        chunks = steps // PROGRESS_CHUNK
+        if chunks != self._progress_chunks:
+            self._progress_chunks = chunks
+            self._progress_mesh.indices = ARC_INDICES[:6 * PROGRESS_CHUNK * chunks] + START_CAP_INDICES
+        first = chunks * PROGRESS_CHUNK
+        whole = steps - first
+        a = radians(val_angle)
+        ux, uy = sin(a), cos(a)
+        end_x, end_y = cx + r * ux, cy + r * uy
+        ro, ri = r + progress_hw, r - progress_hw
+        verts = self._progress_arc[8 * first:8 * (steps + 1)]
+        base = len(verts) // 4
+        verts.extend((cx + ro * ux, cy + ro * uy, 0, 0, cx + ri * ux, cy + ri * uy, 0, 0))
+        verts.extend(disc_vertices(end_x, end_y, progress_hw))
+        tail = [2 * whole, 2 * whole + 1, base, 2 * whole + 1, base + 1, base]
+        self._progress_tail_mesh.vertices = verts
+        self._progress_tail_mesh.indices = ARC_INDICES[:6 * whole] + tail + offset_indices(DISC_INDICES, base + 2)
+
+        # needle, in the same convention as the ticks
+        tip_x, tip_y = cx + r * 0.85 * cos(a), cy + r * 0.85 * sin(a)
+        needle_hw = dp(2)
+        self._needle_mesh.vertices = (
+            segment_vertices(cx, cy, tip_x, tip_y, needle_hw)
+            + disc_vertices(cx, cy, needle_hw)
+            + disc_vertices(tip_x, tip_y, needle_hw)
+        )
+        self._needle_mesh.indices = NEEDLE_INDICES
+
+        self.value_label.text = f"{int(self.value)}%"
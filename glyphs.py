@@ -0,0 +1,112 @@
+from collections import OrderedDict
+
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics import Color, Rectangle
+from kivy.metrics import sp
+from kivy.properties import ListProperty, NumericProperty, StringProperty
+from kivy.uix.widget import Widget
+
+# Characters pre-rasterized into every atlas; anything else is rasterized lazily.
+GLYPH_CHARSET = "0123456789:%-"
+
+
+class GlyphAtlas:
+    """
+    Digits and separators rasterized once per font size into a single texture.
+
+    Each glyph is exposed as a sub-texture region of that texture, so composing
+    a clock time or gauge value never goes through the font renderer again.
+    """
+
+    _atlases = OrderedDict()
+    _MAX_ATLASES = 8
+
+    def __init__(self, font_size: int):
+        self.font_size = font_size
+        self.glyphs = {}
+        self.height = 0
+        self._rasterize_charset()
+
+    @classmethod
+    def for_size(cls, font_size: float) -> "GlyphAtlas":
+        key = max(1, int(round(font_size)))
+        atlas = cls._atlases.get(key)
+        if atlas is None:
+            atlas = cls._atlases[key] = cls(key)
+            if len(cls._atlases) > cls._MAX_ATLASES:
+                cls._atlases.popitem(last=False)
+        else:
+            cls._atlases.move_to_end(key)
+        return atlas
+
+    def _rasterize_charset(self):
+        # glyphs are spaced apart so neighbours cannot kern into each other
+        text = " ".join(GLYPH_CHARSET)
+        label = CoreLabel(text=text, font_size=self.font_size)
+        label.refresh()
+        texture = label.texture
+        self.height = texture.height
+        for i, ch in enumerate(GLYPH_CHARSET):
+            x = label.get_extents(text[:2 * i])[0] if i else 0
+            w = label.get_extents(ch)[0]
+            self.glyphs[ch] = texture.get_region(x, 0, w, texture.height)
+
+    def _rasterize_single(self, ch: str):
+        label = CoreLabel(text=ch, font_size=self.font_size)
+        label.refresh()
+        self.glyphs[ch] = label.texture
+        return label.texture
+
+    def glyph(self, ch: str):
+        texture = self.glyphs.get(ch)
+        if texture is None:
+            texture = self._rasterize_single(ch)
+        return texture
+
+    def measure(self, text: str) -> tuple[float, float]:
+        return sum(self.glyph(ch).width for ch in text), self.height
+
+
+class GlyphLabel(Widget):
+    """
+    Centered single-line text composed from ``GlyphAtlas`` sub-textures.
+
+    A drop-in for a plain ``Label`` where the text is made of digits and a
+    few separators and changes often (clocks, gauge values).
+    """
+
+    text = StringProperty("")
+    font_size = NumericProperty(sp(15))
+    color = ListProperty([1, 1, 1, 1])
+
+    def __init__(self, **kwargs):
+        self._rects = []
+        super().__init__(**kwargs)
+        with self.canvas:
+            self._color = Color(*self.color)
+        self.bind(text=self._layout, font_size=self._layout, pos=self._layout, size=self._layout)
+        self.bind(color=self._update_color)
+        self._layout()
+
+    def _update_color(self, *args):
+        self._color.rgba = self.color
+
+    def _layout(self, *args):
+        atlas = GlyphAtlas.for_size(self.font_size)
+        text = self.text
+        while len(self._rects) < len(text):
+            rect = Rectangle(size=(0, 0))
+            self.canvas.add(rect)
+            self._rects.append(rect)
+        total_w, h = atlas.measure(text)
+        x = self.center_x - total_w / 2.0
+        y = self.center_y - h / 2.0
+        for i, rect in enumerate(self._rects):
+            if i < len(text):
+                texture = atlas.glyph(text[i])
+                rect.texture = texture
+                rect.pos = (x, y)
+                rect.size = texture.size
+                x += texture.width
+            else:
+                rect.size = (0, 0)
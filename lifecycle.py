@@ -0,0 +1,120 @@
+from weakref import WeakMethod
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+
+def _weak(callback):
+    # bound methods are held weakly so registering never keeps a widget alive
+    if callback is None:
+        return None
+    if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+        return WeakMethod(callback)
+    return lambda: callback
+
+
+class PeriodicJob:
+    """A ``Clock.schedule_interval`` job that the lifecycle manager can suspend."""
+
+    def __init__(self, manager, callback, interval: float):
+        self.manager = manager
+        self.interval = interval
+        self._callback = _weak(callback)
+        self._event = None
+
+    @property
+    def alive(self) -> bool:
+        return self._callback() is not None
+
+    def _start(self, catch_up: bool = False):
+        callback = self._callback()
+        if callback is None or self._event is not None:
+            return
+        self._event = Clock.schedule_interval(callback, self.interval)
+        if catch_up:
+            callback(0)
+
+    def _stop(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def cancel(self):
+        self._stop()
+        self.manager._forget(self)
+
+
+class LifecycleManager:
+    """
+    Central switch for everything that runs periodically.
+
+    Widgets schedule their timers through ``schedule_interval`` and long-lived
+    workers register ``on_pause``/``on_resume`` hooks. The app pauses the
+    manager when it is backgrounded or the window is hidden; every job stops
+    until the last pause reason is cleared, then each job runs once to catch
+    up and resumes its cadence.
+    """
+
+    def __init__(self):
+        self._jobs = []
+        self._listeners = []
+        self._reasons = set()
+
+    @property
+    def paused(self) -> bool:
+        return bool(self._reasons)
+
+    def schedule_interval(self, callback, interval: float) -> PeriodicJob:
+        job = PeriodicJob(self, callback, interval)
+        self._jobs.append(job)
+        if not self.paused:
+            job._start()
+        return job
+
+    def add_listener(self, on_pause=None, on_resume=None) -> None:
+        self._listeners.append((_weak(on_pause), _weak(on_resume)))
+
+    def _forget(self, job: PeriodicJob) -> None:
+        try:
+            self._jobs.remove(job)
+        except ValueError:
+            pass
+
+    def _prune(self):
+        self._jobs = [job for job in self._jobs if job.alive]
+        self._listeners = [
+            (p, r) for p, r in self._listeners
+            if (p is None or p() is not None) and (r is None or r() is not None)
+        ]
+
+    def pause(self, reason: str = "app") -> None:
+        was_paused = self.paused
+        self._reasons.add(reason)
+        if was_paused:
+            return
+        Logger.info(f"Lifecycle: pausing ({reason})")
+        self._prune()
+        for job in self._jobs:
+            job._stop()
+        for on_pause, _ in self._listeners:
+            callback = on_pause() if on_pause is not None else None
+            if callback is not None:
+                callback()
+
+    def resume(self, reason: str = "app") -> None:
+        if reason not in self._reasons:
+            return
+        self._reasons.discard(reason)
+        if self.paused:
+            return
+        Logger.info(f"Lifecycle: resuming ({reason})")
+        self._prune()
+        for job in list(self._jobs):
+            job._start(catch_up=True)
+        for _, on_resume in self._listeners:
+            callback = on_resume() if on_resume is not None else None
+            if callback is not None:
+                callback()
+
+
+lifecycle = LifecycleManager()
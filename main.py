@@ -1,12 +1,14 @@
-import threading
-import time
+import os
 import traceback
-from datetime import timedelta
+from datetime import date, datetime, timedelta
+from functools import partial
 from importlib import import_module
 
 from kivy.config import Config
 
-Config.set('graphics', 'maxfps', '60')
+from performance import profile, report_footprint
+
+Config.set('graphics', 'maxfps', str(profile.max_fps))
 
 from kivy.lang import Builder
 from kivy.metrics import dp
@@ -21,8 +23,12 @@ except Exception:
     MDApp = App
     from kivy.uix.boxlayout import BoxLayout as MDCard
 
-from widgets import DigitalClock, MonthCalendar, EventsPanel, DayScheduleModal
+from widgets import DigitalClock, MonthCalendar, EventsPanel, DayScheduleModal, Event, event_index
 from gauge import Gauge
+from lifecycle import lifecycle
+from recording import PayloadRecorder, ReplaySource
+from scheduler import ResourceScheduler
+from viewmodel import PayloadProcessor, REVERSE_COLOR_METRICS, extract_events
 
 # optional keep-awake via plyer
 plyer_keepawake = None
@@ -33,8 +39,22 @@ try:
 except Exception:
     plyer_keepawake = None
 
-BASE_URL = "http://192.168.1.30:8001"
-BASE_FLOAT = 0.0
+BASE_URL = os.environ.get("MACANDRO_BASE_URL", "http://192.168.1.30:8001")
+# record received payloads to, or replay them from, a log file instead of polling
+RECORD_PATH = os.environ.get("MACANDRO_RECORD")
+REPLAY_PATH = os.environ.get("MACANDRO_REPLAY")
+REPLAY_SPEED = float(os.environ.get("MACANDRO_REPLAY_SPEED", "1.0"))
+
+# per-resource cadence: metrics move every few seconds, calendar events rarely
+STATS_INTERVAL = 2.0
+STATS_TIMEOUT = 2.0
+EVENTS_INTERVAL = 60.0
+EVENTS_TIMEOUT = 3.0
+# days the events feed covers, starting today; the panel lists all upcoming ones
+EVENTS_DAYS = 7
+DAY_EVENTS_TIMEOUT = 3.0
+# how long past events stay searchable
+SEARCH_RETENTION = timedelta(days=30)
 
 KV = """
 #:import dp kivy.metrics.dp
@@ -60,67 +80,17 @@ MDBoxLayout:
 """
 
 
-def parse_iso_to_local(value):
-    if not value:
-        return None
-    s = str(value).strip()
-    if s.endswith("Z"):
-        s = s[:-1] + "+00:00"
-    try:
-        from datetime import datetime as _dt
-        dt = _dt.fromisoformat(s)
-    except Exception:
-        try:
-            from dateutil import parser
-            dt = parser.isoparse(s)
-        except Exception:
-            return None
-    if getattr(dt, "tzinfo", None) is None:
-        dt = dt.astimezone()
-    return dt.astimezone()
-
-
-class StatsFetcher(threading.Thread):
-    def __init__(self, url, callback, interval=2.0):
-        super().__init__(daemon=True)
-        self.url = url
-        self.callback = callback
-        self.interval = interval
-        self.running = True
-        try:
-            import requests
-            self.requests = requests
-        except Exception:
-            self.requests = None
-
-    def run(self):
-        while self.running:
-            start = time.time()
-            data = {}
-            try:
-                if self.requests:
-                    r = self.requests.get(self.url, timeout=2)
-                    data = r.json() if r is not None else {}
-            except Exception:
-                data = {}
-            try:
-                Clock.schedule_once(lambda *_: self.callback(data))
-            except Exception:
-                pass
-            elapsed = time.time() - start
-            time.sleep(max(0, self.interval - elapsed))
-
-    def stop(self):
-        self.running = False
-
-
 class DashboardApp(MDApp):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.gauges = {}
         self.events_panel = EventsPanel()
         self._last_events = []
-        self._fetcher = None
+        self._scheduler = None
+        self._replay = None
+        self._events_feed = None
+        self._recorder = None
+        self._processor = PayloadProcessor()
         self.api_url = f"{BASE_URL}/stats"
 
     def build(self):
@@ -131,11 +101,18 @@ class DashboardApp(MDApp):
             Window.allow_screensaver = False
         except Exception:
             pass
+        # a hidden or minimized window means the display is blanked
+        Window.bind(
+            on_hide=lambda *_: lifecycle.pause("window"),
+            on_show=lambda *_: lifecycle.resume("window"),
+            on_minimize=lambda *_: lifecycle.pause("window"),
+            on_restore=lambda *_: lifecycle.resume("window"),
+        )
 
         root = Builder.load_string(KV)
 
         def gauge_card(title, key, reverse=False):
-            card = MDCard(orientation="vertical", padding=dp(8), radius=[16], elevation=6)
+            card = MDCard(orientation="vertical", padding=dp(8), radius=[16], elevation=profile.card_elevation)
             g = Gauge(label=title, reverse_color_logic=reverse)
             card.add_widget(g)
             self.gauges[key] = g
@@ -144,46 +121,98 @@ class DashboardApp(MDApp):
         gauge_card("CPU", "cpu")
         gauge_card("Memory", "mem")
         gauge_card("Network", "net")
-        gauge_card("Battery", "power", reverse=True)
+        gauge_card("Battery", "power", reverse="power" in REVERSE_COLOR_METRICS)
 
         from kivy.uix.boxlayout import BoxLayout as KBox
         clocks_box = KBox(orientation="vertical", spacing=dp(10))
         clocks_box.add_widget(DigitalClock(tz="local", title="New Delhi"))
         clocks_box.add_widget(DigitalClock(tz="Europe/Berlin", title="Munich"))
-        ccard = MDCard(orientation="vertical", padding=dp(12), radius=[16], elevation=6)
+        ccard = MDCard(orientation="vertical", padding=dp(12), radius=[16], elevation=profile.card_elevation)
         ccard.add_widget(clocks_box)
         root.ids.bottom_row.add_widget(ccard)
 
-        cal_card = MDCard(orientation="vertical", padding=dp(12), radius=[16], elevation=6)
+        cal_card = MDCard(orientation="vertical", padding=dp(12), radius=[16], elevation=profile.card_elevation)
         cal_card.add_widget(MonthCalendar())
         root.ids.bottom_row.add_widget(cal_card)
 
-        ev_card = MDCard(orientation="vertical", padding=dp(12), radius=[16], elevation=6)
+        ev_card = MDCard(orientation="vertical", padding=dp(12), radius=[16], elevation=profile.card_elevation)
         ev_card.add_widget(self.events_panel)
         root.ids.bottom_row.add_widget(ev_card)
         self._start_fetcher()
         return root
 
     def _start_fetcher(self):
-        if self._fetcher is None:
-            self._fetcher = StatsFetcher(self.api_url, self.show_data)
-            self._fetcher.start()
+        if self._scheduler is not None:
+            return
+        # the scheduler always runs so day lookups work during replays too
+        self._scheduler = ResourceScheduler()
+        sources = [self._scheduler]
+        if REPLAY_PATH:
+            self._replay = ReplaySource(REPLAY_PATH, self.apply_view_model, REPLAY_SPEED, processors={
+                "stats": self._process_stats_payload,
+                "events": self._process_events_payload,
+            })
+            sources.append(self._replay)
+        else:
+            if RECORD_PATH:
+                self._recorder = PayloadRecorder(RECORD_PATH)
+            self._events_feed = self._scheduler.add(
+                "events", self._upcoming_events_url, self.apply_view_model, EVENTS_INTERVAL,
+                timeout=EVENTS_TIMEOUT, priority=5, processor=self._process_events_payload,
+                recorder=self._recorder,
+            )
+            self._scheduler.add(
+                "stats", self.api_url, self.apply_view_model, STATS_INTERVAL,
+                timeout=STATS_TIMEOUT, priority=10, processor=self._process_stats_payload,
+                on_error=lambda *_: self.apply_view_model(self._process_stats_payload({})),
+                recorder=self._recorder,
+            )
+        for source in sources:
+            lifecycle.add_listener(on_pause=source.pause, on_resume=source.resume)
+            source.start()
+
+    @staticmethod
+    def _upcoming_events_url():
+        return f"{BASE_URL}/events?date={date.today().strftime('%Y-%m-%d')}&days={EVENTS_DAYS}"
+
+    def _process_stats_payload(self, result):
+        # the events embedded in /stats are only parsed while the events feed is failing
+        if self._replay is not None:
+            # older recordings only carry /stats, with the events embedded
+            events_feed_ok = "events" in self._replay.seen
+        else:
+            events_feed_ok = self._events_feed is not None and self._events_feed.failures == 0
+        return self._processor.process(result, include_events=not events_feed_ok)
+
+    def _process_events_payload(self, result):
+        return self._processor.process_events(extract_events(result))
 
     def on_start(self):
+        report_footprint("started")
         try:
             if plyer_keepawake is not None:
                 plyer_keepawake.on()
         except Exception:
             pass
 
+    def on_pause(self):
+        lifecycle.pause("app")
+        return True
+
+    def on_resume(self):
+        lifecycle.resume("app")
+
     def on_stop(self):
         try:
             if plyer_keepawake is not None:
                 plyer_keepawake.off()
         except Exception:
             pass
-        if self._fetcher:
-            self._fetcher.stop()
+        for source in (self._scheduler, self._replay):
+            if source:
+                source.stop()
+        if self._recorder:
+            self._recorder.close()
 
     def open_calendar_modal(self, year: int, month: int):
         from widgets.calendar import BigCalendarModal
@@ -199,22 +228,21 @@ class DashboardApp(MDApp):
             traceback.print_exc()
 
     def fetch_events_for_date(self, day_date):
-        # background fetch for events; simple thread wrapper
-        def worker():
-            url = f"{BASE_URL}/events?date={day_date.strftime('%Y-%m-%d')}"
-            evs = []
-            try:
-                import requests
-                r = requests.get(url, timeout=3)
-                result = r.json()
-                if isinstance(result, dict):
-                    evs = result.get("events", []) or result.get("data", [])
-                elif isinstance(result, list):
-                    evs = result
-            except Exception:
-                evs = self._events_for_day(day_date)
-            Clock.schedule_once(lambda *_: DayScheduleModal(evs, day_date).open())
-        threading.Thread(target=worker, daemon=True).start()
+        # on-demand, deduplicated background fetch; falls back to cached events
+        day = day_date.strftime('%Y-%m-%d')
+        self._scheduler.request(
+            f"day:{day}",
+            f"{BASE_URL}/events?date={day}",
+            lambda evs: self._open_day_schedule(evs, day_date),
+            timeout=DAY_EVENTS_TIMEOUT,
+            processor=lambda result: Event.from_list(extract_events(result)),
+            on_error=lambda *_: self._open_day_schedule(self._events_for_day(day_date), day_date),
+        )
+
+    @staticmethod
+    def _open_day_schedule(events, day_date):
+        event_index.add_all(events)
+        DayScheduleModal(events, day_date).open()
 
     def _events_for_day(self, day_date):
         events = self._last_events or []
@@ -224,8 +252,8 @@ class DashboardApp(MDApp):
         day_end = day_start + timedelta(days=1)
         filtered = []
         for ev in events:
-            s = parse_iso_to_local(ev.get("from"))
-            e = parse_iso_to_local(ev.get("to")) or s
+            s = ev.start
+            e = ev.end or s
             if not s:
                 continue
             if e > day_start and s < day_end:
@@ -234,34 +262,42 @@ class DashboardApp(MDApp):
 
     def show_data(self, result):
         """
-        Updates the gauges and events panel using the provided result data. The method extracts specific
-        performance metrics such as CPU, memory, network, and power, then animates the respective
-        gauges to reflect these values. The events data is also updated in the events panel.
+        Updates the gauges and events panel using the provided result data. The payload is turned
+        into a view model synchronously; the fetcher does that step on its own thread and calls
+        ``apply_view_model`` directly.
         :param result: Dictionary
         :type result: Dict
         """
-        def safe_float(v):
-            try:
-                return float(v)
-            except (TypeError, ValueError):
-                return BASE_FLOAT
-
-        cpu = safe_float(result.get("cpu", BASE_FLOAT))
-        mem = safe_float(result.get("mem", BASE_FLOAT))
-        net = safe_float(result.get("net", BASE_FLOAT))
-        power = safe_float(result.get("power", BASE_FLOAT))
-        events = result.get("events", []) if isinstance(result, dict) else []
+        self.apply_view_model(self._processor.process(result))
 
+    def apply_view_model(self, vm):
+        """
+        Animates each gauge to its clamped metric value and target color, and rebuilds the events
+        panel from preformatted rows when the event list changed.
+        :param vm: Processed payload
+        :type vm: DashboardViewModel
+        """
         stagger = 0.08
-        Clock.schedule_once(lambda *_: self.gauges.get("cpu") and self.gauges["cpu"].animate_to(cpu), 0 * stagger)
-        Clock.schedule_once(lambda *_: self.gauges.get("mem") and self.gauges["mem"].animate_to(mem), 1 * stagger)
-        Clock.schedule_once(lambda *_: self.gauges.get("net") and self.gauges["net"].animate_to(net), 2 * stagger)
-        Clock.schedule_once(lambda *_: self.gauges.get("power") and self.gauges["power"].animate_to(power), 3 * stagger)
-
-        validated_events = self.events_panel.get_validated_events(events)
-        if validated_events != self._last_events:
-            self._last_events = validated_events
-            self.events_panel.update_events(validated_events)
+        for i, metric in enumerate(vm.metrics):
+            gauge = self.gauges.get(metric.key)
+            if gauge is not None:
+                Clock.schedule_once(partial(self._animate_gauge, gauge, metric), i * stagger)
+
+        if vm.events is None:
+            return
+        if vm.events_changed:
+            event_index.prune(datetime.now().astimezone() - SEARCH_RETENTION)
+            event_index.add_all(vm.events)
+            self._processor.mark_applied(vm.events)
+        self._last_events = list(vm.events)
+        # The panel drops expired events itself, so a change that only reflects
+        # an expiry it already applied does not need a rebuild.
+        if vm.events_changed and self._last_events != self.events_panel.events:
+            self.events_panel.update_rows(vm.rows)
+
+    @staticmethod
+    def _animate_gauge(gauge, metric, *args):
+        gauge.animate_to(metric.value, color=metric.color)
 
 
 if __name__ == "__main__":
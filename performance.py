@@ -0,0 +1,102 @@
+import os
+import sys
+from typing import NamedTuple
+
+from kivy.logger import Logger
+
+GIB = 1024 ** 3
+
+
+class PerformanceProfile(NamedTuple):
+    name: str
+    max_fps: int
+    clock_hz: float
+    gauge_halo: bool
+    card_elevation: int
+    rich_event_rows: bool
+    calendar_refresh: float
+
+
+PROFILES = {
+    "full": PerformanceProfile(
+        name="full",
+        max_fps=60,
+        clock_hz=30,
+        gauge_halo=True,
+        card_elevation=6,
+        rich_event_rows=True,
+        calendar_refresh=30,
+    ),
+    # cheap tablets and kiosks: fewer frames and timer wakeups, no shadows or
+    # halos, plain Kivy labels instead of KivyMD list items
+    "lite": PerformanceProfile(
+        name="lite",
+        max_fps=30,
+        clock_hz=4,
+        gauge_halo=False,
+        card_elevation=0,
+        rich_event_rows=False,
+        calendar_refresh=120,
+    ),
+}
+
+LITE_MAX_RAM = 3 * GIB
+LITE_MAX_CPUS = 4
+
+
+def device_ram_bytes() -> int:
+    try:
+        with open("/proc/meminfo") as fh:
+            for line in fh:
+                if line.startswith("MemTotal:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return 0
+
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+        # ru_maxrss is KiB on Linux/Android, bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    except Exception:
+        return 0
+
+
+def detect_profile() -> PerformanceProfile:
+    """Pick a profile from ``MACANDRO_PROFILE`` or, failing that, device RAM and CPU count."""
+    forced = os.environ.get("MACANDRO_PROFILE", "").strip().lower()
+    if forced in PROFILES:
+        return PROFILES[forced]
+    ram = device_ram_bytes()
+    cpus = os.cpu_count() or 1
+    if (ram and ram < LITE_MAX_RAM) or cpus <= LITE_MAX_CPUS:
+        return PROFILES["lite"]
+    return PROFILES["full"]
+
+
+def report_footprint(label: str = "") -> int:
+    """Log the process RSS next to the active profile and return it in bytes."""
+    rss = rss_bytes()
+    ram = device_ram_bytes()
+    suffix = f" ({label})" if label else ""
+    Logger.info(
+        f"Performance: profile={profile.name} rss={rss / 2 ** 20:.1f}MiB "
+        f"device_ram={ram / GIB:.1f}GiB cpus={os.cpu_count()}{suffix}"
+    )
+    return rss
+
+
+profile = detect_profile()
@@ -0,0 +1,142 @@
+import gzip
+import json
+import threading
+import time
+import traceback
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+GZIP_MAGIC = b"\x1f\x8b"
+# resource assumed for lines written before recordings were tagged
+DEFAULT_RESOURCE = "stats"
+
+
+def _open_text(path: str, mode: str):
+    if "r" in mode:
+        with open(path, "rb") as fh:
+            compressed = fh.read(2) == GZIP_MAGIC
+    else:
+        compressed = path.endswith(".gz")
+    if compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class PayloadRecorder:
+    """
+    Appends every received payload with its wall-clock timestamp and the
+    name of the resource it came from to a JSON lines log, gzip-compressed
+    when the path ends in ``.gz``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        self._fh = _open_text(path, "a")
+
+    def record(self, payload, resource: str = DEFAULT_RESOURCE) -> None:
+        line = json.dumps({"t": round(time.time(), 3), "r": resource, "p": payload}, separators=(",", ":"))
+        with self._lock:
+            if self._fh is None:
+                return
+            self._fh.write(line + "\n")
+            # push every line to disk (a gzip sync flush, so the stream stays
+            # readable) and a crash or kill loses at most the current payload
+            self._fh.flush()
+            self.count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+        Logger.info(f"Recording: wrote {self.count} payloads to {self.path}")
+
+
+def read_recording(path: str):
+    """
+    Yield ``(timestamp, resource, payload)`` from a recording, skipping
+    damaged lines and stopping at the last complete one of a truncated file.
+    """
+    with _open_text(path, "r") as fh:
+        lines = iter(fh)
+        while True:
+            try:
+                line = next(lines)
+            except StopIteration:
+                return
+            except (EOFError, OSError) as exc:
+                # gzip stream cut off, e.g. by a crash while recording
+                Logger.warning(f"Recording: {path} is truncated ({exc})")
+                return
+            try:
+                entry = json.loads(line)
+                yield float(entry["t"]), str(entry.get("r", DEFAULT_RESOURCE)), entry["p"]
+            except (ValueError, KeyError, TypeError):
+                continue
+
+
+class ReplaySource(threading.Thread):
+    """
+    Feeds a recording to ``callback`` on the UI thread, keeping the recorded
+    spacing divided by ``speed`` (``speed=0`` replays back to back).
+
+    ``processors`` maps resource names to the processor each payload runs
+    through on this thread, as it does for scheduled resources; payloads of
+    other resources are passed on unchanged. ``pause``/``resume``/``stop``
+    match ``ResourceScheduler`` so the lifecycle manager can drive either.
+    """
+
+    def __init__(self, path: str, callback, speed: float = 1.0, processors: dict | None = None,
+                 loop: bool = False):
+        super().__init__(daemon=True)
+        self.path = path
+        self.callback = callback
+        self.speed = speed
+        self.processors = processors or {}
+        self.loop = loop
+        self.running = True
+        self.delivered = 0
+        # resources replayed so far
+        self.seen = set()
+        self._active = threading.Event()
+        self._active.set()
+        self._wake = threading.Event()
+
+    def run(self):
+        while self.running:
+            previous = None
+            for stamp, resource, payload in read_recording(self.path):
+                if not self.running:
+                    return
+                if previous is not None and self.speed > 0:
+                    self._wake.wait(max(0.0, (stamp - previous) / self.speed))
+                    self._wake.clear()
+                previous = stamp
+                self._active.wait()
+                if not self.running:
+                    return
+                self.seen.add(resource)
+                processor = self.processors.get(resource)
+                try:
+                    data = processor(payload) if processor else payload
+                    Clock.schedule_once(lambda *_, data=data: self.callback(data))
+                    self.delivered += 1
+                except Exception:
+                    traceback.print_exc()
+            Logger.info(f"Replay: delivered {self.delivered} payloads from {self.path}")
+            if not self.loop:
+                break
+
+    def pause(self):
+        self._active.clear()
+
+    def resume(self):
+        self._active.set()
+
+    def stop(self):
+        self.running = False
+        self._active.set()
+        self._wake.set()
@@ -0,0 +1,63 @@
+from functools import partial
+
+from kivy.clock import Clock
+
+
+class RedrawStats:
+    """Process-wide counters for coalesced redraws."""
+
+    def __init__(self):
+        self.requested = 0
+        self.performed = 0
+        self.skipped = 0
+
+    def snapshot(self) -> dict:
+        return {"requested": self.requested, "performed": self.performed, "skipped": self.skipped}
+
+
+redraw_stats = RedrawStats()
+
+
+class CoalescedRedrawMixin:
+    """
+    Dirty-flag redraws for widgets: property changes only mark named parts
+    dirty, and a single trigger runs ``redraw(dirty_parts)`` once before the
+    next frame, however many changes arrived in between.
+
+    Subclasses implement ``redraw(parts)`` and wire properties with
+    ``bind_redraw(part, *properties)``.
+    """
+
+    def _redraw_trigger(self):
+        trigger = getattr(self, "_redraw_trigger_event", None)
+        if trigger is None:
+            # -1: after this frame's layout pass, before drawing
+            trigger = self._redraw_trigger_event = Clock.create_trigger(self._flush_redraw, -1)
+            self._dirty_parts = set()
+        return trigger
+
+    def bind_redraw(self, part: str, *properties) -> None:
+        mark = partial(self._mark_dirty_from_binding, part)
+        self.bind(**{name: mark for name in properties})
+
+    def _mark_dirty_from_binding(self, part, *args):
+        self.mark_dirty(part)
+
+    def mark_dirty(self, part: str = "all") -> None:
+        trigger = self._redraw_trigger()
+        redraw_stats.requested += 1
+        if trigger.is_triggered:
+            redraw_stats.skipped += 1
+        self._dirty_parts.add(part)
+        trigger()
+
+    def _flush_redraw(self, *args) -> None:
+        parts = self._dirty_parts
+        if not parts:
+            return
+        self._dirty_parts = set()
+        redraw_stats.performed += 1
+        self.redraw(parts)
+
+    def redraw(self, parts: set) -> None:
+        raise NotImplementedError
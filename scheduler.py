@@ -0,0 +1,226 @@
+import heapq
+import random
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+
+class _NotModified(Exception):
+    pass
+
+
+class Resource:
+    """
+    One polled or on-demand backend resource.
+
+    ``url`` may be a callable so date-dependent URLs are rebuilt per request.
+    ``processor`` runs on the worker thread; ``callback`` (and ``on_error``)
+    run on the UI thread.
+    """
+
+    def __init__(self, name, url, callback, interval=None, timeout=2.0, priority=0, jitter=0.1,
+                 processor=None, on_error=None, recorder=None):
+        self.name = name
+        self.url = url
+        self.callbacks = [callback] if callback else []
+        self.interval = interval
+        self.timeout = timeout
+        self.priority = priority
+        self.jitter = jitter
+        self.processor = processor
+        self.on_error = on_error
+        self.recorder = recorder
+        self.in_flight = False
+        self.failures = 0
+        # validator of the last delivered response, sent back as If-None-Match
+        self.etag = None
+
+    @property
+    def periodic(self) -> bool:
+        return bool(self.interval)
+
+    def resolve_url(self) -> str:
+        return self.url() if callable(self.url) else self.url
+
+    def next_delay(self) -> float:
+        # jitter keeps resources (and dashboards) from polling in lockstep
+        spread = self.interval * self.jitter
+        return max(0.0, self.interval + random.uniform(-spread, spread))
+
+
+class ResourceScheduler(threading.Thread):
+    """
+    Polls each resource at its own cadence on a small worker pool.
+
+    Entries move from a time-ordered heap into a ready queue once due, and a
+    worker is only handed the highest ``priority`` ready resource when it is
+    free, so a backlog of due fetches drains in priority order. A resource is
+    never fetched twice concurrently, and on-demand ``request`` calls that
+    share a key with a queued or in-flight one are coalesced onto that fetch.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        super().__init__(daemon=True)
+        self.running = True
+        self._resources = {}
+        self._heap = []
+        self._ready = []
+        self._seq = count()
+        self._max_workers = max_workers
+        self._busy = 0
+        self._cond = threading.Condition()
+        self._paused = False
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch")
+        self._local = threading.local()
+        try:
+            import requests
+            self.requests = requests
+        except Exception:
+            self.requests = None
+
+    def add(self, name, url, callback, interval, **options) -> Resource:
+        resource = Resource(name, url, callback, interval=interval, **options)
+        with self._cond:
+            self._resources[name] = resource
+            self._push(resource, 0.0)
+        return resource
+
+    def request(self, key, url, callback, timeout=3.0, priority=100, processor=None, on_error=None) -> None:
+        """Fetch ``url`` once, joining a queued or in-flight request with the same ``key``."""
+        with self._cond:
+            resource = self._resources.get(key)
+            if resource is not None and not resource.periodic:
+                resource.callbacks.append(callback)
+                return
+            resource = Resource(key, url, callback, timeout=timeout, priority=priority,
+                                processor=processor, on_error=on_error)
+            self._resources[key] = resource
+            self._push(resource, 0.0)
+
+    def _push(self, resource: Resource, delay: float) -> None:
+        heapq.heappush(self._heap, (time.monotonic() + delay, -resource.priority, next(self._seq), resource))
+        self._cond.notify()
+
+    def _next_ready(self):
+        """Highest-priority due resource if a worker is free; call with ``_cond`` held."""
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            _, neg_priority, seq, resource = heapq.heappop(self._heap)
+            heapq.heappush(self._ready, (neg_priority, seq, resource))
+        while self._ready and self._busy < self._max_workers:
+            resource = heapq.heappop(self._ready)[-1]
+            if self._resources.get(resource.name) is resource and not resource.in_flight:
+                return resource
+        return None
+
+    def run(self):
+        while self.running:
+            with self._cond:
+                resource = None
+                while self.running:
+                    if not self._paused:
+                        resource = self._next_ready()
+                        if resource is not None:
+                            break
+                    if self._paused or not self._heap:
+                        self._cond.wait()
+                    else:
+                        # woken early by new entries and finished workers
+                        self._cond.wait(max(0.0, self._heap[0][0] - time.monotonic()))
+                if resource is None:
+                    break
+                resource.in_flight = True
+                self._busy += 1
+            try:
+                self._pool.submit(self._execute, resource)
+            except RuntimeError:
+                # pool already shut down by stop()
+                break
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None and self.requests is not None:
+            # one keep-alive session per worker thread
+            session = self._local.session = self.requests.Session()
+        return session
+
+    def _execute(self, resource: Resource) -> None:
+        error = None
+        payload = None
+        not_modified = False
+        etag = None
+        try:
+            session = self._session()
+            if session is None:
+                raise RuntimeError("requests is not available")
+            headers = {"If-None-Match": resource.etag} if resource.etag and resource.periodic else None
+            r = session.get(resource.resolve_url(), timeout=resource.timeout, headers=headers)
+            if r.status_code == 304:
+                raise _NotModified
+            r.raise_for_status()
+            data = r.json()
+            etag = r.headers.get("ETag")
+            if resource.recorder is not None:
+                resource.recorder.record(data, resource.name)
+            payload = resource.processor(data) if resource.processor else data
+        except _NotModified:
+            # nothing changed since the last delivery: skip parsing and callbacks
+            not_modified = True
+        except Exception as exc:
+            error = exc
+        with self._cond:
+            resource.in_flight = False
+            self._busy -= 1
+            self._cond.notify()
+            callbacks = list(resource.callbacks)
+            if resource.periodic:
+                resource.failures = resource.failures + 1 if error else 0
+                if self.running and self._resources.get(resource.name) is resource:
+                    self._push(resource, resource.next_delay())
+            else:
+                self._resources.pop(resource.name, None)
+            deliver = self.running and not self._paused and not not_modified
+            if not not_modified:
+                # only a delivered payload may be validated against later; after a
+                # dropped one or a failure the next fetch must get a full 200
+                resource.etag = etag if deliver and error is None else None
+        if not deliver:
+            return
+        if error is not None:
+            Logger.debug(f"Scheduler: {resource.name} failed: {error!r}")
+            if resource.on_error is not None:
+                Clock.schedule_once(lambda *_: resource.on_error(error))
+            return
+        for callback in callbacks:
+            Clock.schedule_once(lambda *_, cb=callback: self._deliver(cb, payload))
+
+    @staticmethod
+    def _deliver(callback, payload):
+        try:
+            callback(payload)
+        except Exception:
+            traceback.print_exc()
+
+    def pause(self):
+        with self._cond:
+            self._paused = True
+
+    def resume(self):
+        """Resume with one immediate catch-up fetch of every periodic resource."""
+        with self._cond:
+            self._paused = False
+            pending = [entry[-1] for entry in self._heap]
+            self._heap = []
+            for resource in pending:
+                self._push(resource, 0.0)
+
+    def stop(self):
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,202 @@
+"""
+End-to-end offscreen frame-throughput benchmark for the full dashboard.
+
+Builds the real ``DashboardApp`` widget tree without a fetcher, renders it
+into an offscreen Fbo and drives synthetic ``show_data`` payloads, calendar
+swipes and schedule-modal opens at several window sizes::
+
+    xvfb-run python -m tools.bench_dashboard --frames 600 --sizes 800x480,1280x800,1920x1080
+
+Each frame runs the same steps as Kivy's ``EventLoop.idle`` (clock tick,
+canvas sync, before-draw triggers), so coalesced redraws land in the frame
+that requested them. Reports frames per second and p50/p99 frame time for
+each size, then traces a shorter pass with tracemalloc (kept out of the timed
+frames) for allocations still live and peak traced bytes per frame;
+``--replay`` feeds a recorded stats stream instead of synthetic payloads.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from tools.mock_server import MockBackend
+
+
+def parse_sizes(raw: str) -> list[tuple[int, int]]:
+    sizes = []
+    for part in raw.split(","):
+        w, h = part.lower().split("x")
+        sizes.append((int(w), int(h)))
+    return sizes
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+def allocations_between(before, after) -> int:
+    """Blocks allocated by lines that grew between two snapshots."""
+    return sum(stat.count_diff for stat in after.compare_to(before, "lineno") if stat.count_diff > 0)
+
+
+def payload_source(args):
+    if args.replay:
+        from recording import read_recording
+        payloads = [payload for _, resource, payload in read_recording(args.replay) if resource == "stats"]
+        if not payloads:
+            sys.exit(f"no payloads in {args.replay}")
+        while True:
+            yield from payloads
+    backend = MockBackend(events=args.events, seed=args.seed)
+    while True:
+        yield backend.stats()
+
+
+def run_size(app_cls, size, args) -> dict:
+    from kivy.clock import Clock
+    from kivy.graphics import Fbo, ClearColor, ClearBuffers
+    from kivy.graphics.opengl import glFinish
+    from kivy.lang import Builder
+    from kivy.uix.floatlayout import FloatLayout
+    from redraw import redraw_stats
+    from widgets import DayScheduleModal, DigitalClock, MonthCalendar
+
+    app = app_cls()
+    container = FloatLayout(size=size, size_hint=(None, None))
+    container.add_widget(app.build())
+    fbo = Fbo(size=size)
+    with fbo:
+        ClearColor(0, 0, 0, 1)
+        ClearBuffers()
+    fbo.add(container.canvas)
+    calendar = next(w for w in container.walk() if isinstance(w, MonthCalendar))
+    payloads = payload_source(args)
+
+    def render():
+        # EventLoop.idle without input: -1 triggers run before this frame's draw
+        Clock.tick()
+        Builder.sync()
+        Clock.tick_draw()
+        Builder.sync()
+        fbo.draw()
+        glFinish()
+
+    modal = None
+
+    def drive(frame):
+        nonlocal modal
+        if frame % args.data_every == 0:
+            app.show_data(next(payloads))
+        if frame % args.swipe_every == 0:
+            calendar._shift_month(1 if (frame // args.swipe_every) % 2 == 0 else -1)
+        if frame % args.modal_every == 0:
+            modal = DayScheduleModal(app._last_events, datetime.now())
+            modal.size_hint = (None, None)
+            modal.size = (size[0] * 0.98, size[1] * 0.98)
+            container.add_widget(modal)
+        elif modal is not None and frame % args.modal_every == args.modal_every // 2:
+            container.remove_widget(modal)
+            modal = None
+        render()
+
+    # settle the initial layout before measuring
+    for _ in range(10):
+        render()
+
+    frame_times = []
+    redraws_before = redraw_stats.snapshot()
+    for frame in range(args.frames):
+        t0 = time.perf_counter()
+        drive(frame)
+        frame_times.append(time.perf_counter() - t0)
+    redraws = redraw_stats.performed - redraws_before["performed"]
+    skipped = redraw_stats.skipped - redraws_before["skipped"]
+
+    allocations = []
+    peaks = []
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(ignore)
+    for frame in range(args.frames, args.frames + args.alloc_frames):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        drive(frame)
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+        after = tracemalloc.take_snapshot().filter_traces(ignore)
+        allocations.append(allocations_between(before, after))
+        before = after
+    tracemalloc.stop()
+    app.on_stop()
+    # stop this tree's periodic jobs so they do not tick during the next size
+    for widget in container.walk():
+        if isinstance(widget, DigitalClock):
+            widget._job.cancel()
+        elif isinstance(widget, MonthCalendar):
+            widget._refresh_job.cancel()
+
+    total = sum(frame_times)
+    result = {
+        "size": f"{size[0]}x{size[1]}",
+        "frames": len(frame_times),
+        "fps": round(len(frame_times) / total, 1) if total else 0.0,
+        "p50_ms": round(percentile(frame_times, 50) * 1000, 2),
+        "p99_ms": round(percentile(frame_times, 99) * 1000, 2),
+        "allocs_per_frame": round(statistics.fmean(allocations), 1) if allocations else 0.0,
+        "peak_bytes_per_frame": round(statistics.fmean(peaks)) if peaks else 0,
+        "redraws": redraws,
+        "redraws_skipped": skipped,
+    }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=600, help="measured frames per size")
+    parser.add_argument("--sizes", default="800x480,1280x800,1920x1080")
+    parser.add_argument("--events", type=int, default=40, help="events per synthetic payload")
+    parser.add_argument("--data-every", type=int, default=30, help="frames between show_data updates")
+    parser.add_argument("--swipe-every", type=int, default=90, help="frames between calendar swipes")
+    parser.add_argument("--modal-every", type=int, default=120, help="frames between schedule modal opens")
+    parser.add_argument("--replay", help="recorded stats stream to use instead of synthetic payloads")
+    parser.add_argument("--alloc-frames", type=int, default=60, help="traced frames per size for allocation counts")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    from kivy.clock import Clock
+    from main import DashboardApp
+
+    class BenchApp(DashboardApp):
+        def _start_fetcher(self):
+            # no network: payloads are driven by the benchmark loop
+            pass
+
+    # measure throughput, not the maxfps cap
+    Clock._max_fps = 0
+
+    results = [run_size(BenchApp, size, args) for size in parse_sizes(args.sizes)]
+    print(
+        f"{'size':>10} {'fps':>8} {'p50 ms':>8} {'p99 ms':>8} {'allocs/f':>9} {'peak B/f':>9} "
+        f"{'redraws':>8} {'skipped':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['size']:>10} {r['fps']:>8} {r['p50_ms']:>8} {r['p99_ms']:>8} {r['allocs_per_frame']:>9} "
+            f"{r['peak_bytes_per_frame']:>9} {r['redraws']:>8} {r['redraws_skipped']:>8}"
+        )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
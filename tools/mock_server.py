@@ -0,0 +1,166 @@
+"""
+Local stand-in for the dashboard backend.
+
+Serves ``/stats`` and ``/events?date=YYYY-MM-DD[&days=N]`` with the same
+schema as the real host, with configurable event volume, latency and failure rate::
+
+    python -m tools.mock_server --port 8001 --events 40 --latency 150 --failure-rate 0.05
+
+Point the app at it with ``MACANDRO_BASE_URL=http://127.0.0.1:8001``.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+TITLES = ["Standup", "Design review", "1:1", "Planning", "Retro", "Lunch", "Customer call", "Interview", "Deep work"]
+ORGANIZERS = ["Asha", "Marco", "Lena", "Kenji", "Priya", "Tom"]
+LOCATIONS = ["", "Room A", "Room B", "Cafeteria", "Online"]
+
+
+class MockBackend:
+    """Generates metric random walks and deterministic per-day event lists."""
+
+    def __init__(self, events: int = 12, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 failure_rate: float = 0.0, seed: int | None = None):
+        self.events = events
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.seed = seed if seed is not None else random.randrange(1 << 30)
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+        self._metrics = {"cpu": 30.0, "mem": 55.0, "net": 10.0, "power": 90.0}
+        self.requests = 0
+
+    def _walk(self, key: str, step: float) -> float:
+        value = self._metrics[key] + self._rng.uniform(-step, step)
+        self._metrics[key] = value = max(0.0, min(100.0, value))
+        return round(value, 1)
+
+    def stats(self) -> dict:
+        with self._lock:
+            metrics = {
+                "cpu": self._walk("cpu", 12),
+                "mem": self._walk("mem", 3),
+                "net": self._walk("net", 20),
+                "power": self._walk("power", 0.5),
+            }
+        metrics["events"] = self.events_for(date.today())
+        return metrics
+
+    def events_for(self, day: date) -> list[dict]:
+        # seeded by the day so repeated polls return identical payloads
+        rng = random.Random(f"{self.seed}:{day.isoformat()}")
+        day_start = datetime(day.year, day.month, day.day).astimezone()
+        events = []
+        for _ in range(self.events):
+            start = day_start + timedelta(minutes=rng.randrange(7 * 60, 20 * 60, 15))
+            end = start + timedelta(minutes=rng.choice([15, 30, 45, 60, 90]))
+            events.append({
+                "title": rng.choice(TITLES),
+                "organizer": rng.choice(ORGANIZERS),
+                "location": rng.choice(LOCATIONS),
+                "from": start.isoformat(),
+                "to": end.isoformat(),
+            })
+        return events
+
+    def delay(self) -> None:
+        latency = self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        if latency > 0:
+            time.sleep(latency / 1000.0)
+
+    def should_fail(self) -> bool:
+        return self.failure_rate > 0 and self._rng.random() < self.failure_rate
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    backend: MockBackend = None
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send_json(self, payload, status: int = 200) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        backend = self.backend
+        backend.requests += 1
+        backend.delay()
+        if backend.should_fail():
+            self._send_json({"error": "injected failure"}, status=500)
+            return
+        url = urlparse(self.path)
+        if url.path == "/stats":
+            self._send_json(backend.stats())
+        elif url.path == "/events":
+            query = parse_qs(url.query)
+            raw = query.get("date", [""])[0]
+            try:
+                day = date.fromisoformat(raw) if raw else date.today()
+                days = max(1, int(query.get("days", ["1"])[0]))
+            except ValueError:
+                self._send_json({"error": f"bad date {raw!r} or days"}, status=400)
+                return
+            events = []
+            for offset in range(days):
+                events.extend(backend.events_for(day + timedelta(days=offset)))
+            self._send_json({"events": events})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+
+def start_server(backend: MockBackend, host: str = "127.0.0.1", port: int = 8001) -> ThreadingHTTPServer:
+    """Start the mock server on a daemon thread and return it (``port=0`` picks a free port)."""
+    handler = type("BoundMockHandler", (MockHandler,), {"backend": backend})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--events", type=int, default=12, help="events per day")
+    parser.add_argument("--latency", type=float, default=0.0, help="response latency in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="latency jitter in ms")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser
+
+
+def backend_from_args(args) -> MockBackend:
+    return MockBackend(
+        events=args.events,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+
+
+def main():
+    args = build_arg_parser().parse_args()
+    server = start_server(backend_from_args(args), args.host, args.port)
+    print(f"mock backend on http://{server.server_address[0]}:{server.server_address[1]}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
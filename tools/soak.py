@@ -0,0 +1,138 @@
+"""
+Long-running soak and memory-leak harness.
+
+Runs ``DashboardApp`` against the local mock backend for hours and appends one
+JSON sample per interval with RSS, tracemalloc totals and top growth sites,
+live widget counts and scheduled Clock events::
+
+    xvfb-run python -m tools.soak --hours 12 --events 60 --out soak.jsonl
+
+It also periodically opens and dismisses the calendar and day-schedule
+modals, which is where rebuilt widgets and ``Clock.schedule_once`` lambdas
+are most likely to accumulate.
+"""
+import gc
+import json
+import os
+import time
+import tracemalloc
+import weakref
+from collections import Counter
+from datetime import datetime
+
+from performance import rss_bytes
+from redraw import redraw_stats
+from tools.mock_server import build_arg_parser, backend_from_args, start_server
+
+
+def widget_counts(widget_cls) -> Counter:
+    """Live instances of ``widget_cls`` subclasses by class name, not counting weak proxies."""
+    from kivy.weakproxy import WeakProxy
+    proxy_types = weakref.ProxyTypes + (WeakProxy,)
+    gc.collect()
+    counts = Counter()
+    for o in gc.get_objects():
+        # type() never goes through a proxy, so dead proxies cannot raise here
+        cls = type(o)
+        if issubclass(cls, proxy_types) or not issubclass(cls, widget_cls):
+            continue
+        counts[cls.__name__] += 1
+    return counts
+
+
+class SoakRunner:
+    def __init__(self, app, args):
+        self.app = app
+        self.args = args
+        self.started = time.monotonic()
+        self.baseline = None
+        self.out = open(args.out, "a", encoding="utf-8")
+
+    def start(self, *_):
+        from kivy.clock import Clock
+        tracemalloc.start(self.args.trace_depth)
+        self.baseline = tracemalloc.take_snapshot()
+        Clock.schedule_interval(self.sample, self.args.sample_every)
+        if self.args.modal_every > 0:
+            Clock.schedule_interval(self.exercise_modals, self.args.modal_every)
+        self.sample(0)
+
+    def exercise_modals(self, *_):
+        from kivy.clock import Clock
+        now = datetime.now()
+        self.app.open_calendar_modal(now.year, now.month)
+        self.app.fetch_events_for_date(now)
+        Clock.schedule_once(self.dismiss_modals, self.args.modal_every / 2.0)
+
+    @staticmethod
+    def dismiss_modals(*_):
+        from kivy.core.window import Window
+        from kivy.uix.modalview import ModalView
+        for child in list(Window.children):
+            if isinstance(child, ModalView):
+                child.dismiss(animation=False)
+
+    def sample(self, *_):
+        from kivy.clock import Clock
+        from kivy.uix.widget import Widget
+        elapsed = time.monotonic() - self.started
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        growth = snapshot.compare_to(self.baseline, "lineno")[: self.args.top]
+        widgets = widget_counts(Widget)
+        record = {
+            "t": round(elapsed, 1),
+            "rss": rss_bytes(),
+            "traced": current,
+            "traced_peak": peak,
+            "widgets": sum(widgets.values()),
+            "widget_types": dict(widgets.most_common(self.args.top)),
+            "clock_events": len(Clock.get_events()),
+            "redraws": redraw_stats.snapshot(),
+            "growth": [
+                {"site": str(stat.traceback[0]), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                for stat in growth
+            ],
+        }
+        self.out.write(json.dumps(record) + "\n")
+        self.out.flush()
+        print(
+            f"[soak] t={record['t']:>8}s rss={record['rss'] / 1e6:.1f}MB traced={current / 1e6:.1f}MB "
+            f"widgets={record['widgets']} clock_events={record['clock_events']}"
+        )
+        if elapsed >= self.args.hours * 3600:
+            self.out.close()
+            self.app.stop()
+            return False
+
+
+def main():
+    parser = build_arg_parser()
+    parser.description = __doc__.strip().splitlines()[0]
+    parser.set_defaults(port=0)
+    parser.add_argument("--hours", type=float, default=1.0, help="soak duration")
+    parser.add_argument("--sample-every", type=float, default=60.0, help="seconds between samples")
+    parser.add_argument("--modal-every", type=float, default=120.0, help="seconds between modal cycles (0 disables)")
+    parser.add_argument("--top", type=int, default=10, help="growth sites and widget types per sample")
+    parser.add_argument("--trace-depth", type=int, default=1, help="tracemalloc frames per allocation")
+    parser.add_argument("--out", default="soak.jsonl")
+    args = parser.parse_args()
+
+    server = start_server(backend_from_args(args), args.host, args.port)
+    host, port = server.server_address[:2]
+    os.environ["MACANDRO_BASE_URL"] = f"http://{host}:{port}"
+
+    # imported late so main picks up the mock base url
+    from main import DashboardApp
+
+    app = DashboardApp()
+    runner = SoakRunner(app, args)
+    app.bind(on_start=runner.start)
+    try:
+        app.run()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+Reference host collector serving the dashboard's ``/stats`` schema.
+
+Samples CPU, memory, network and battery on one background thread at a fixed
+rate, using delta counters read from already-open ``/proc`` files (psutil is
+used instead when ``/proc`` is unavailable). Every request is answered from
+the cached snapshot with an ETag, so dashboards that send ``If-None-Match``
+get an empty 304 until the next sample::
+
+    python -m tools.stats_collector --port 8001 --interval 2 --link-mbps 100 --events-file events.json
+
+``--events-file`` (a JSON list, or an object with an ``events`` list) is
+reloaded when it changes and also backs ``/events?date=YYYY-MM-DD[&days=N]``.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from glob import glob
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _clamp(value: float) -> float:
+    return round(max(0.0, min(100.0, value)), 1)
+
+
+def _parse_time(value) -> datetime | None:
+    """ISO timestamp as an aware local datetime, like ``widgets.models.parse_iso_to_local``."""
+    if not value:
+        return None
+    s = str(value).strip()
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        return None
+    return dt.astimezone()
+
+
+class ProcReader:
+    """A ``/proc`` or ``/sys`` file kept open and re-read from offset 0."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, "rb", buffering=0)
+
+    def read(self) -> bytes:
+        self._fh.seek(0)
+        return self._fh.read()
+
+
+class HostSampler:
+    """Delta-based host metrics; call ``sample()`` once per interval."""
+
+    def __init__(self, link_mbps: float = 100.0):
+        self.link_bytes_per_sec = link_mbps * 1_000_000 / 8
+        self._use_proc = os.path.exists("/proc/stat")
+        if not self._use_proc and psutil is None:
+            raise RuntimeError("no metric source: /proc is unavailable and psutil is not installed")
+        self._prev_cpu = None
+        self._prev_net = None
+        self._prev_time = None
+        if self._use_proc:
+            self._stat = ProcReader("/proc/stat")
+            self._meminfo = ProcReader("/proc/meminfo")
+            self._netdev = ProcReader("/proc/net/dev")
+        self._battery = None
+        for supply in glob("/sys/class/power_supply/*"):
+            try:
+                with open(os.path.join(supply, "type")) as fh:
+                    if fh.read().strip() == "Battery":
+                        self._battery = ProcReader(os.path.join(supply, "capacity"))
+                        break
+            except OSError:
+                continue
+
+    def _cpu_times(self) -> tuple[int, int]:
+        if self._use_proc:
+            fields = [int(v) for v in self._stat.read().split(b"\n", 1)[0].split()[1:]]
+            idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+            return sum(fields) - idle, sum(fields)
+        t = psutil.cpu_times()
+        total = sum(t)
+        return total - t.idle - getattr(t, "iowait", 0.0), total
+
+    def _mem_percent(self) -> float:
+        if self._use_proc:
+            info = {}
+            for line in self._meminfo.read().splitlines():
+                key, _, rest = line.partition(b":")
+                if key in (b"MemTotal", b"MemAvailable"):
+                    info[key] = int(rest.split()[0])
+                    if len(info) == 2:
+                        break
+            total = info.get(b"MemTotal", 0)
+            return 100.0 * (total - info.get(b"MemAvailable", total)) / total if total else 0.0
+        return psutil.virtual_memory().percent
+
+    def _net_bytes(self) -> int:
+        if self._use_proc:
+            total = 0
+            for line in self._netdev.read().splitlines()[2:]:
+                name, _, rest = line.partition(b":")
+                if name.strip() == b"lo":
+                    continue
+                cols = rest.split()
+                total += int(cols[0]) + int(cols[8])
+            return total
+        counters = psutil.net_io_counters()
+        return counters.bytes_recv + counters.bytes_sent
+
+    def _power_percent(self) -> float:
+        if self._battery is not None:
+            try:
+                return float(self._battery.read().strip())
+            except (OSError, ValueError):
+                return 100.0
+        if psutil is not None:
+            battery = psutil.sensors_battery()
+            if battery is not None:
+                return battery.percent
+        # mains-powered host
+        return 100.0
+
+    def sample(self) -> dict:
+        now = time.monotonic()
+        busy, total = self._cpu_times()
+        net = self._net_bytes()
+        cpu = net_pct = 0.0
+        if self._prev_cpu is not None:
+            d_busy, d_total = busy - self._prev_cpu[0], total - self._prev_cpu[1]
+            cpu = 100.0 * d_busy / d_total if d_total > 0 else 0.0
+            elapsed = now - self._prev_time
+            if elapsed > 0:
+                net_pct = 100.0 * (net - self._prev_net) / elapsed / self.link_bytes_per_sec
+        self._prev_cpu, self._prev_net, self._prev_time = (busy, total), net, now
+        return {
+            "cpu": _clamp(cpu),
+            "mem": _clamp(self._mem_percent()),
+            "net": _clamp(net_pct),
+            "power": _clamp(self._power_percent()),
+        }
+
+
+class EventsFile:
+    """Events loaded from a JSON file, reloaded only when its mtime changes."""
+
+    def __init__(self, path: str | None):
+        self.path = path
+        self._mtime = None
+        self.events = []
+        # (start, end, event) with parsed times, for day lookups
+        self._spans = []
+
+    def refresh(self) -> bool:
+        if not self.path:
+            return False
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return False
+        if mtime == self._mtime:
+            return False
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return False
+        self._mtime = mtime
+        self.events = data.get("events", []) if isinstance(data, dict) else list(data)
+        self._spans = []
+        for ev in self.events:
+            if not isinstance(ev, dict):
+                continue
+            start = _parse_time(ev.get("from"))
+            if start is not None:
+                self._spans.append((start, _parse_time(ev.get("to")) or start, ev))
+        return True
+
+    def for_day(self, day: date, days: int = 1) -> list[dict]:
+        """Events overlapping ``days`` local calendar days from ``day``, including ones that span midnight."""
+        day_start = datetime(day.year, day.month, day.day).astimezone()
+        day_end = day_start + timedelta(days=days)
+        return [ev for start, end, ev in self._spans if end > day_start and start < day_end]
+
+
+class Snapshot:
+    """Serialized response body with its strong ETag."""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, payload):
+        self.body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self.etag = '"' + hashlib.blake2b(self.body, digest_size=8).hexdigest() + '"'
+
+
+class StatsCollector:
+    # /events snapshots kept, least recently requested dropped first
+    MAX_DAY_SNAPSHOTS = 32
+
+    def __init__(self, interval: float = 2.0, link_mbps: float = 100.0, events_file: str | None = None):
+        self.interval = interval
+        self.sampler = HostSampler(link_mbps)
+        self.events = EventsFile(events_file)
+        self.snapshot = Snapshot({})
+        self._days = OrderedDict()
+        self._days_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        self._tick()
+        threading.Thread(target=self._loop, daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self._tick()
+
+    def _tick(self):
+        if self.events.refresh():
+            with self._days_lock:
+                self._days.clear()
+        payload = self.sampler.sample()
+        payload["events"] = self.events.for_day(date.today())
+        # a single reference swap; request threads never see a partial snapshot
+        self.snapshot = Snapshot(payload)
+
+    def day_snapshot(self, day: date, days: int = 1) -> Snapshot:
+        key = (day, days)
+        with self._days_lock:
+            snap = self._days.get(key)
+            if snap is None:
+                snap = self._days[key] = Snapshot({"events": self.events.for_day(day, days)})
+                if len(self._days) > self.MAX_DAY_SNAPSHOTS:
+                    self._days.popitem(last=False)
+            else:
+                self._days.move_to_end(key)
+        return snap
+
+
+class CollectorHandler(BaseHTTPRequestHandler):
+    collector: StatsCollector = None
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send_snapshot(self, snap: Snapshot) -> None:
+        if self.headers.get("If-None-Match") == snap.etag:
+            self.send_response(304)
+            self.send_header("ETag", snap.etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(snap.body)))
+        self.send_header("ETag", snap.etag)
+        self.send_header("Cache-Control", f"max-age={int(self.collector.interval)}")
+        self.end_headers()
+        self.wfile.write(snap.body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/stats":
+            self._send_snapshot(self.collector.snapshot)
+        elif url.path == "/events":
+            query = parse_qs(url.query)
+            raw = query.get("date", [""])[0]
+            try:
+                day = date.fromisoformat(raw) if raw else date.today()
+                days = max(1, int(query.get("days", ["1"])[0]))
+            except ValueError:
+                self.send_error(400, f"bad date {raw!r} or days")
+                return
+            self._send_snapshot(self.collector.day_snapshot(day, days))
+        else:
+            self.send_error(404)
+
+
+def serve(collector: StatsCollector, host: str = "0.0.0.0", port: int = 8001) -> ThreadingHTTPServer:
+    handler = type("BoundCollectorHandler", (CollectorHandler,), {"collector": collector})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--interval", type=float, default=2.0, help="seconds between samples")
+    parser.add_argument("--link-mbps", type=float, default=100.0, help="link speed that maps to 100%% network")
+    parser.add_argument("--events-file", help="JSON file with calendar events")
+    args = parser.parse_args()
+
+    try:
+        collector = StatsCollector(args.interval, args.link_mbps, args.events_file)
+    except RuntimeError as exc:
+        sys.exit(f"stats collector: {exc}")
+    collector.start()
+    server = serve(collector, args.host, args.port)
+    print(f"stats collector on http://{args.host}:{args.port} (every {args.interval}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        collector.stop()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
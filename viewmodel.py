@@ -0,0 +1,88 @@
+from threading import Lock
+from typing import NamedTuple
+
+from gauge import progress_color_for
+from widgets import Event, EventRow, EventsPanel
+
+BASE_FLOAT = 0.0
+
+METRIC_KEYS = ("cpu", "mem", "net", "power")
+# metrics where a low value is the bad case
+REVERSE_COLOR_METRICS = frozenset({"power"})
+
+
+class MetricState(NamedTuple):
+    key: str
+    value: float
+    color: tuple
+
+
+class DashboardViewModel(NamedTuple):
+    """
+    Everything the UI thread needs to render one payload. ``metrics`` is empty
+    and ``events`` is ``None`` when the payload did not carry that part.
+    """
+
+    metrics: tuple[MetricState, ...]
+    events: tuple[Event, ...] | None
+    rows: tuple[EventRow, ...]
+    events_changed: bool
+
+
+def extract_events(result) -> list:
+    """Event list from an ``/events`` response (``events``/``data`` key or a bare list)."""
+    if isinstance(result, dict):
+        return result.get("events", []) or result.get("data", []) or []
+    if isinstance(result, list):
+        return result
+    return []
+
+
+def safe_float(v) -> float:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return BASE_FLOAT
+
+
+class PayloadProcessor:
+    """
+    Turns raw ``/stats`` payloads into immutable view models.
+
+    Meant to run on the fetch thread, so parsing, validation, sorting and
+    formatting never compete with frames; the UI thread only applies the
+    result.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        # the event list the UI last applied, not the last one processed: a
+        # view model dropped on the way (e.g. while paused) must not count
+        self._applied_events = ()
+
+    def process(self, result, include_events: bool = True) -> DashboardViewModel:
+        """Full ``/stats`` payload; ``include_events=False`` skips its event list entirely."""
+        if not isinstance(result, dict):
+            result = {}
+        metrics = []
+        for key in METRIC_KEYS:
+            value = max(0.0, min(100.0, safe_float(result.get(key, BASE_FLOAT))))
+            metrics.append(MetricState(key, value, progress_color_for(value, key in REVERSE_COLOR_METRICS)))
+        if not include_events:
+            return DashboardViewModel(tuple(metrics), None, (), False)
+        return self.process_events(result.get("events", []) or [], tuple(metrics))
+
+    def process_events(self, raw_events: list, metrics: tuple = ()) -> DashboardViewModel:
+        events = tuple(EventsPanel.get_validated_events(raw_events))
+        with self._lock:
+            # identity-cached records make this a cheap element-wise identity check
+            changed = events != self._applied_events
+        rows = EventsPanel.build_rows(events) if changed else ()
+        return DashboardViewModel(metrics, events, rows, changed)
+
+    def mark_applied(self, events: tuple) -> None:
+        """Record ``events`` as shown; called by the UI thread once a view model is applied."""
+        with self._lock:
+            self._applied_events = events
+
+    __call__ = process
@@ -1,13 +1,20 @@
 from .clocks import DigitalClock
 from .calendar import MonthCalendar, BigCalendarModal
-from .events import EventsPanel
+from .events import EventsPanel, EventRow
 from .timeline import DayScheduleView, DayScheduleModal
+from .models import Event
+from .search import EventIndex, EventSearchBar, event_index
 
 __all__ = [
     "DigitalClock",
     "MonthCalendar",
     "BigCalendarModal",
     "EventsPanel",
+    "EventRow",
     "DayScheduleView",
     "DayScheduleModal",
+    "Event",
+    "EventIndex",
+    "EventSearchBar",
+    "event_index",
 ]
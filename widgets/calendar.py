@@ -1,7 +1,6 @@
 import calendar as pycalendar
 from datetime import datetime
 
-from kivy.clock import Clock
 from kivy.metrics import dp
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.boxlayout import BoxLayout
@@ -18,6 +17,8 @@ from colors import (
     CAL_DAY_TODAY,
     BG_MODAL,
 )
+from lifecycle import lifecycle
+from performance import profile
 
 
 class DayCell(ButtonBehavior, Label):
@@ -80,7 +81,7 @@ class MonthCalendar(BoxLayout):
         self.add_widget(self.title)
         self.add_widget(self.header)
         self._build()
-        Clock.schedule_interval(self._maybe_refresh, 30)
+        self._refresh_job = lifecycle.schedule_interval(self._maybe_refresh, profile.calendar_refresh)
 
     def _set_month(self, year: int, month: int):
         y, m = year, month
@@ -1,12 +1,14 @@
 from datetime import datetime
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from kivy.clock import Clock
-from kivy.metrics import dp
+from kivy.metrics import dp, sp
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 
 from colors import CLOCK_LOCAL_COLOR, CLOCK_TZ_COLOR
+from glyphs import GlyphLabel
+from lifecycle import lifecycle
+from performance import profile
 
 
 class DigitalClock(BoxLayout):
@@ -15,11 +17,11 @@ class DigitalClock(BoxLayout):
         self.tz = tz
         color = CLOCK_LOCAL_COLOR if tz == "local" else CLOCK_TZ_COLOR
         self.title = Label(text=title, color=color, font_size="16sp", size_hint_y=None, height=dp(18))
-        self.time_lbl = Label(text="--:--:--", markup=True, color=color, font_size="50sp")
+        self.time_lbl = GlyphLabel(text="--:--:--", color=color, font_size=sp(50))
         self.add_widget(self.title)
         self.add_widget(self.time_lbl)
         self._last_sec = None
-        Clock.schedule_interval(self._update_time, 1 / 30)
+        self._job = lifecycle.schedule_interval(self._update_time, 1 / profile.clock_hz)
         self._update_time(0)
 
     def _get_now(self):
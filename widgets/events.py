@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from typing import NamedTuple
 
 from kivy.metrics import dp
 from kivy.uix.boxlayout import BoxLayout
@@ -10,9 +11,23 @@ from kivymd.uix.list import (
     MDListItemSupportingText,
 )
 
-from colors import TEXT_SUBTLE, EVENT_HIGHLIGHT
+from colors import TEXT_PRIMARY, TEXT_SUBTLE, EVENT_HIGHLIGHT
+from performance import profile
+from .expiry import EventExpiryScheduler, TRANSITION_START
+from .models import Event
+from .search import EventSearchBar
 
 CLEAR_EVENT_START_BUFFER_MINUTES = 2
+# rows built for a search; further matches are summarised as "+N more"
+SEARCH_RESULT_LIMIT = 30
+
+
+class EventRow(NamedTuple):
+    """An event with its list texts already formatted."""
+
+    event: Event
+    title: str
+    subtitle: str
 
 
 class EventListItem(MDListItem):
@@ -29,7 +44,7 @@ class EventListItem(MDListItem):
         title_color = EVENT_HIGHLIGHT if highlight else (1, 1, 1, 1)
         subtitle_color = TEXT_SUBTLE
 
-        headline = MDListItemHeadlineText(
+        self.headline = headline = MDListItemHeadlineText(
             text=title,
             font_style="Label",
             theme_text_color="Custom",
@@ -49,25 +64,30 @@ class EventListItem(MDListItem):
         self.add_widget(headline)
         self.add_widget(supporting)
 
+    def set_highlight(self, highlight: bool):
+        self.headline.text_color = EVENT_HIGHLIGHT if highlight else (1, 1, 1, 1)
+
+
+class LiteEventListItem(BoxLayout):
+    """Two-line event row built from plain Kivy labels, for the lite profile."""
+
+    def __init__(self, title: str, subtitle: str = "", highlight=False, **kwargs):
+        super().__init__(orientation="vertical", size_hint_y=None, height=dp(44), padding=(dp(12), dp(2)), **kwargs)
+        self.headline = Label(
+            text=title,
+            color=EVENT_HIGHLIGHT if highlight else TEXT_PRIMARY,
+            font_size="14sp",
+            halign="left",
+            valign="middle",
+            shorten=True,
+        )
+        supporting = Label(text=subtitle, color=TEXT_SUBTLE, font_size="12sp", halign="left", valign="middle")
+        for lbl in (self.headline, supporting):
+            lbl.bind(size=lambda inst, size: setattr(inst, "text_size", size))
+            self.add_widget(lbl)
 
-# ---------- Helper to parse ISO timestamps ----------
-def parse_iso_to_local(value):
-    if not value:
-        return None
-    s = str(value).strip()
-    if s.endswith("Z"):
-        s = s[:-1] + "+00:00"
-    try:
-        dt = datetime.fromisoformat(s)
-    except ValueError:
-        try:
-            from dateutil import parser
-            dt = parser.isoparse(s)
-        except (ValueError, TypeError):
-            return None
-    if dt.tzinfo is None:
-        dt = dt.astimezone()
-    return dt.astimezone()
+    def set_highlight(self, highlight: bool):
+        self.headline.color = EVENT_HIGHLIGHT if highlight else TEXT_PRIMARY
 
 
 # ---------- Main Events Panel ----------
@@ -84,6 +104,9 @@ class EventsPanel(BoxLayout):
         )
         self.add_widget(self.title)
 
+        self.search_bar = EventSearchBar(self.show_search_results)
+        self.add_widget(self.search_bar)
+
         self.scroll = ScrollView(size_hint=(1, 1))
         self.list = BoxLayout(
             orientation="vertical",
@@ -95,6 +118,18 @@ class EventsPanel(BoxLayout):
         self.scroll.add_widget(self.list)
         self.add_widget(self.scroll)
 
+        self.item_cls = EventListItem if profile.rich_event_rows else LiteEventListItem
+        # currently listed events and their rows, in display order
+        self.events = []
+        self._rows = []
+        self._started = set()
+        # search results replace the live rows while a query is active
+        self._search_rows = None
+        self._expiry = EventExpiryScheduler(
+            self._on_transition,
+            timedelta(minutes=CLEAR_EVENT_START_BUFFER_MINUTES),
+        )
+
     @staticmethod
     def _format_slot(start: datetime, end: datetime, location: str | None):
         """Format time slot string like 'Today 16:30-18:00 · Room'."""
@@ -111,30 +146,92 @@ class EventsPanel(BoxLayout):
         return f"{date_part} {time_part}{loc_part}"
 
     def __clear_event_list(self):
-        self.list.clear_widgets()
+        if self._search_rows is None:
+            self.list.clear_widgets()
+        self._rows = []
+        self._started.clear()
 
     @staticmethod
-    def get_validated_events(events: list):
+    def get_validated_events(events: list) -> list[Event]:
+        """
+        Return upcoming events as sorted ``Event`` records, dropping ones already under way and
+        start-less ones that have ended, matching what the expiry queue removes.
+        """
         validated_events = []
-        local_now = datetime.now().astimezone()
-        for event in events:
-            start = parse_iso_to_local(event.get("from"))
-            end = parse_iso_to_local(event.get("to"))
-            if start is None and end is None:
+        now = datetime.now().astimezone()
+        cutoff = now - timedelta(minutes=CLEAR_EVENT_START_BUFFER_MINUTES)
+        for event in Event.from_list(events):
+            if event.start:
+                if event.start <= cutoff:
+                    continue
+            elif event.end and event.end <= now:
                 continue
-            sort_key = start or end or local_now
-            if start and start <= (local_now - timedelta(minutes=CLEAR_EVENT_START_BUFFER_MINUTES)):
-                continue
-            validated_events.append((sort_key, event, start, end))
+            validated_events.append(event)
+        validated_events.sort(key=lambda ev: ev.sort_key)
         return validated_events
 
-    def update_events(self, validated_events: list[tuple]):
+    @classmethod
+    def build_rows(cls, events) -> tuple[EventRow, ...]:
+        return tuple(EventRow(ev, ev.display_title, cls._format_slot(ev.start, ev.end, ev.location)) for ev in events)
+
+    def update_events(self, validated_events: list[Event]):
+        self.update_rows(self.build_rows(validated_events or []))
+
+    def update_rows(self, rows):
+        """Rebuild the list from preformatted ``EventRow`` entries."""
         self.__clear_event_list()
-        if not validated_events:
+        self.events = [row.event for row in rows]
+        now = datetime.now().astimezone()
+        for idx, (ev, title, subtitle) in enumerate(rows):
+            if ev.start and ev.start <= now:
+                self._started.add(ev)
+            li = self.item_cls(title=title, subtitle=subtitle, highlight=self._is_highlighted(idx, ev))
+            self._rows.append((ev, li))
+            if self._search_rows is None:
+                self.list.add_widget(li)
+        self._expiry.reset(self.events)
+        self.search_bar.refresh()
+
+    def show_search_results(self, events):
+        """Show ``events`` from the search index, or restore the live list for ``None``."""
+        self.list.clear_widgets()
+        if events is None:
+            self._search_rows = None
+            for _, item in self._rows:
+                self.list.add_widget(item)
             return
-        validated_events.sort(key=lambda x: x[0])
-        for idx, (_, ev, start, end) in enumerate(validated_events):
-            title = ev.get("title") or "(No title)"
-            subtitle = self._format_slot(start, end, ev.get("location"))
-            li = EventListItem(title=title, subtitle=subtitle, highlight=(idx == 0))
-            self.list.add_widget(li)
+        shown = events[:SEARCH_RESULT_LIMIT]
+        self._search_rows = [
+            self.item_cls(title=title, subtitle=subtitle) for _, title, subtitle in self.build_rows(shown)
+        ]
+        hidden = len(events) - len(shown)
+        if hidden:
+            self._search_rows.append(Label(
+                text=f"+{hidden} more, refine the search",
+                color=TEXT_SUBTLE,
+                font_size="12sp",
+                size_hint_y=None,
+                height=dp(24),
+            ))
+        for item in self._search_rows:
+            self.list.add_widget(item)
+
+    def _is_highlighted(self, idx: int, ev: Event) -> bool:
+        return idx == 0 or ev in self._started
+
+    def _on_transition(self, kind: str, ev: Event):
+        """Apply a single start/expiry transition without rebuilding the list."""
+        if kind == TRANSITION_START:
+            self._started.add(ev)
+        else:
+            rows = [row for row in self._rows if row[0] is not ev]
+            if len(rows) == len(self._rows):
+                return
+            for event, item in self._rows:
+                if event is ev:
+                    self.list.remove_widget(item)
+            self._rows = rows
+            self._started.discard(ev)
+            self.events = [event for event, _ in rows]
+        for idx, (event, item) in enumerate(self._rows):
+            item.set_highlight(self._is_highlighted(idx, event))
@@ -0,0 +1,70 @@
+import heapq
+from datetime import datetime, timedelta
+from itertools import count
+
+from kivy.clock import Clock
+
+from .models import Event
+
+TRANSITION_START = "start"
+TRANSITION_EXPIRE = "expire"
+TRANSITION_END = "end"
+
+
+class EventExpiryScheduler:
+    """
+    Priority queue of upcoming event transitions driven by a single Clock timer.
+
+    Each event contributes its start, its start + ``buffer`` expiry (the point
+    at which the list drops it) or, for events without a start, its end. Only
+    the nearest transition is armed; when it fires, every due transition is
+    handed to ``on_transition(kind, event)`` and the next one is armed.
+    """
+
+    def __init__(self, on_transition, buffer: timedelta):
+        self.on_transition = on_transition
+        self.buffer = buffer
+        self._heap = []
+        self._seq = count()
+        self._timer = None
+
+    def __len__(self):
+        return len(self._heap)
+
+    def reset(self, events: list[Event]) -> None:
+        now = datetime.now().astimezone()
+        heap = []
+        for ev in events:
+            if ev.start:
+                if ev.start > now:
+                    heap.append((ev.start, next(self._seq), TRANSITION_START, ev))
+                heap.append((ev.start + self.buffer, next(self._seq), TRANSITION_EXPIRE, ev))
+            elif ev.end:
+                heap.append((ev.end, next(self._seq), TRANSITION_END, ev))
+        heapq.heapify(heap)
+        self._heap = heap
+        self._arm()
+
+    def cancel(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._heap = []
+
+    def _arm(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._heap:
+            return
+        delay = (self._heap[0][0] - datetime.now().astimezone()).total_seconds()
+        self._timer = Clock.schedule_once(self._fire, max(0.0, delay))
+
+    def _fire(self, *args) -> None:
+        self._timer = None
+        now = datetime.now().astimezone()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, kind, ev = heapq.heappop(heap)
+            self.on_transition(kind, ev)
+        self._arm()
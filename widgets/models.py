@@ -0,0 +1,117 @@
+from datetime import datetime
+from sys import intern
+
+
+# ---------- Helper to parse ISO timestamps ----------
+def parse_iso_to_local(value):
+    if not value:
+        return None
+    s = str(value).strip()
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        try:
+            from dateutil import parser
+            dt = parser.isoparse(s)
+        except (ValueError, TypeError, ImportError):
+            return None
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
+    return dt.astimezone()
+
+
+def _text(value) -> str:
+    return intern(str(value)) if value else ""
+
+
+class Event:
+    """
+    Immutable, slotted calendar event with pre-parsed local times.
+
+    Strings are interned so repeated payloads share storage, and the same raw
+    entry always maps to the same instance (see ``from_dict``), which lets
+    consumers detect changes by identity instead of deep comparison.
+    """
+
+    __slots__ = ("title", "organizer", "location", "start", "end", "_key", "_hash")
+
+    _cache: dict = {}
+    _CACHE_LIMIT = 2048
+
+    def __init__(self, title: str, organizer: str, location: str, start: datetime | None, end: datetime | None):
+        set_ = object.__setattr__
+        set_(self, "title", _text(title))
+        set_(self, "organizer", _text(organizer))
+        set_(self, "location", _text(location))
+        set_(self, "start", start)
+        set_(self, "end", end)
+        key = (
+            self.title,
+            self.organizer,
+            self.location,
+            start.timestamp() if start else None,
+            end.timestamp() if end else None,
+        )
+        set_(self, "_key", key)
+        set_(self, "_hash", hash(key))
+
+    @classmethod
+    def from_dict(cls, data) -> "Event | None":
+        """Build (or reuse) an event from a raw API dict; ``None`` if it has no usable time."""
+        if isinstance(data, Event):
+            return data
+        if not isinstance(data, dict):
+            return None
+        raw = (data.get("title"), data.get("organizer"), data.get("location"), data.get("from"), data.get("to"))
+        try:
+            return cls._cache[raw]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable field values; parse without caching
+            raw = None
+        start = parse_iso_to_local(data.get("from"))
+        end = parse_iso_to_local(data.get("to"))
+        if start is None and end is None:
+            return None
+        event = cls(data.get("title"), data.get("organizer"), data.get("location"), start, end)
+        if raw is not None:
+            if len(cls._cache) >= cls._CACHE_LIMIT:
+                cls._cache.clear()
+            cls._cache[raw] = event
+        return event
+
+    @classmethod
+    def from_list(cls, items) -> list["Event"]:
+        events = []
+        for item in items or []:
+            event = cls.from_dict(item)
+            if event is not None:
+                events.append(event)
+        return events
+
+    @property
+    def sort_key(self) -> datetime:
+        return self.start or self.end
+
+    @property
+    def display_title(self) -> str:
+        return self.title or "(No title)"
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Event):
+            return NotImplemented
+        return self._hash == other._hash and self._key == other._key
+
+    def __repr__(self):
+        return f"Event({self.title!r}, start={self.start}, end={self.end})"
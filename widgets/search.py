@@ -0,0 +1,170 @@
+import re
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+
+from kivy.clock import Clock
+from kivy.metrics import dp
+from kivy.uix.textinput import TextInput
+
+from colors import TEXT_PRIMARY, TEXT_MUTED
+from .models import Event
+
+_TOKEN_RE = re.compile(r"\w+")
+# fields that can be targeted with "field:term" in a query
+SEARCH_FIELDS = ("title", "organizer", "location")
+# field-qualified keys start with a non-word character so a bare prefix such
+# as "org" or "title" can never match them
+_FIELD_MARK = "\x00"
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def _field_key(field: str, token: str) -> str:
+    return f"{_FIELD_MARK}{field}:{token}"
+
+
+def _overlaps_day(ev: Event, day: datetime) -> bool:
+    day_start = day.replace(hour=0, minute=0, second=0, microsecond=0).astimezone()
+    day_end = day_start + timedelta(days=1)
+    s = ev.start or ev.end
+    e = ev.end or s
+    return e > day_start and s < day_end
+
+
+class EventIndex:
+    """
+    Incremental inverted index over event title, organizer and location.
+
+    Every token is indexed both bare and qualified by its field
+    (``organizer:asha``, stored behind a marker that bare terms never start
+    with); query terms match as prefixes through a sorted token list, so
+    typing narrows results without a full scan.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._tokens = []
+        self._events = set()
+
+    def __len__(self):
+        return len(self._events)
+
+    def __contains__(self, event):
+        return event in self._events
+
+    def add(self, event: Event) -> bool:
+        if event in self._events:
+            return False
+        self._events.add(event)
+        for field in SEARCH_FIELDS:
+            for token in tokenize(getattr(event, field)):
+                for key in (token, _field_key(field, token)):
+                    posting = self._postings.get(key)
+                    if posting is None:
+                        posting = self._postings[key] = set()
+                        insort(self._tokens, key)
+                    posting.add(event)
+        return True
+
+    def add_all(self, events) -> int:
+        return sum(1 for ev in events if self.add(ev))
+
+    def remove(self, event: Event) -> None:
+        if event not in self._events:
+            return
+        self._events.discard(event)
+        for field in SEARCH_FIELDS:
+            for token in tokenize(getattr(event, field)):
+                for key in (token, _field_key(field, token)):
+                    posting = self._postings.get(key)
+                    if posting is None:
+                        continue
+                    posting.discard(event)
+                    if not posting:
+                        del self._postings[key]
+                        i = bisect_left(self._tokens, key)
+                        if i < len(self._tokens) and self._tokens[i] == key:
+                            del self._tokens[i]
+
+    def prune(self, before: datetime) -> None:
+        """Drop events that ended before ``before``."""
+        for ev in [ev for ev in self._events if (ev.end or ev.start) < before]:
+            self.remove(ev)
+
+    def _prefix_matches(self, term: str) -> set:
+        matches = set()
+        tokens = self._tokens
+        i = bisect_left(tokens, term)
+        while i < len(tokens) and tokens[i].startswith(term):
+            matches |= self._postings[tokens[i]]
+            i += 1
+        return matches
+
+    def search(self, query: str, day: datetime | None = None) -> list[Event]:
+        """
+        Events matching every query term (as a prefix), optionally limited to
+        ``day``; a query without any terms (e.g. ``-``) matches nothing.
+        """
+        result = None
+        for raw in query.lower().split():
+            field, sep, rest = raw.partition(":")
+            if sep and field in SEARCH_FIELDS:
+                terms = [_field_key(field, token) for token in tokenize(rest)]
+            else:
+                terms = tokenize(raw)
+            for term in terms:
+                matches = self._prefix_matches(term)
+                result = matches if result is None else result & matches
+                if not result:
+                    return []
+        if result is None:
+            return []
+        if day is not None:
+            result = [ev for ev in result if _overlaps_day(ev, day)]
+        return sorted(result, key=lambda ev: ev.sort_key)
+
+
+# shared index fed by every event payload and day lookup
+event_index = EventIndex()
+
+
+class EventSearchBar(TextInput):
+    """
+    Single-line search field; calls ``on_results(events)`` after each edit, or
+    ``on_results(None)`` once the query is cleared.
+    """
+
+    def __init__(self, on_results, index: EventIndex = event_index, day: datetime | None = None, **kwargs):
+        super().__init__(
+            multiline=False,
+            hint_text="Search title, organizer:name, location:room",
+            size_hint_y=None,
+            height=dp(32),
+            font_size="14sp",
+            padding=(dp(8), dp(6)),
+            background_color=(0, 0, 0, 0.25),
+            foreground_color=TEXT_PRIMARY,
+            hint_text_color=TEXT_MUTED,
+            cursor_color=TEXT_PRIMARY,
+            **kwargs,
+        )
+        self.index = index
+        self.day = day
+        self.on_results = on_results
+        # one query per frame at most, however fast the user types
+        self._query_trigger = Clock.create_trigger(self._run_query, -1)
+        self.bind(text=lambda *_: self._query_trigger())
+
+    def refresh(self) -> None:
+        """Re-run the current query, e.g. after new events were indexed."""
+        if self.text.strip():
+            self._query_trigger()
+
+    def _run_query(self, *args):
+        query = self.text.strip()
+        if not query:
+            self.on_results(None)
+            return
+        self.on_results(self.index.search(query, day=self.day))
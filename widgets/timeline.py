@@ -17,31 +17,15 @@ from colors import (
     EVENT_BORDER_SHADOW,
     BG_MODAL,
 )
+from redraw import CoalescedRedrawMixin
+from .models import Event
+from .search import EventSearchBar
 
 
-def parse_iso_to_local(value):
-    if not value:
-        return None
-    s = str(value).strip()
-    if s.endswith("Z"):
-        s = s[:-1] + "+00:00"
-    try:
-        dt = datetime.fromisoformat(s)
-    except Exception:
-        try:
-            from dateutil import parser
-            dt = parser.isoparse(s)
-        except Exception:
-            return None
-    if dt.tzinfo is None:
-        dt = dt.astimezone()
-    return dt.astimezone()
-
-
-class DayScheduleView(FloatLayout):
+class DayScheduleView(CoalescedRedrawMixin, FloatLayout):
     def __init__(self, events: list, day_date: datetime, **kwargs):
         super().__init__(**kwargs)
-        self.events = events or []
+        self.all_events = self.events = Event.from_list(events)
         self.day_date = day_date
         self.dp_per_min = dp(1)
         self.left_pad = dp(50)
@@ -51,8 +35,8 @@ class DayScheduleView(FloatLayout):
         self.content_height = int(24 * 60 * self.dp_per_min)
         self.size_hint_y = None
         self.height = self.content_height
-        self.bind(size=self._redraw, pos=self._redraw)
-        Clock.schedule_once(self._redraw, 0)
+        self.bind_redraw("layout", "size", "pos")
+        self.mark_dirty("layout")
 
     @staticmethod
     def _layout_events(items):
@@ -93,6 +77,18 @@ class DayScheduleView(FloatLayout):
                 laid[i] = (s, e, ev, ci, total_cols)
         return laid
 
+    def set_filter(self, events) -> None:
+        """Limit the view to ``events``; ``None`` shows every event of the day."""
+        if events is None:
+            self.events = self.all_events
+        else:
+            shown = set(self.all_events)
+            self.events = [ev for ev in events if ev in shown]
+        self.mark_dirty("layout")
+
+    def redraw(self, parts: set) -> None:
+        self._redraw()
+
     def _redraw(self, *args):
         self.canvas.clear()
         for child in list(self.children):
@@ -117,8 +113,8 @@ class DayScheduleView(FloatLayout):
         day_start = self.day_date.replace(hour=0, minute=0, second=0, microsecond=0).astimezone()
         day_end = day_start + timedelta(days=1)
         for ev in self.events:
-            s = parse_iso_to_local(ev.get("from"))
-            e = parse_iso_to_local(ev.get("to")) or s
+            s = ev.start
+            e = ev.end or s
             if not s:
                 continue
             if e <= day_start or s >= day_end:
@@ -144,7 +140,7 @@ class DayScheduleView(FloatLayout):
                 Rectangle(pos=(x, y), size=(w, h))
                 Color(*EVENT_BORDER_SHADOW)
                 Line(rectangle=(x, y, w, h), width=1)
-            box = Label(text=f"[b]{ev.get('title','(No title)')}[/b] | {ev.get('organizer','')}", markup=True, halign='left', valign='top', color=self.event_text_color)
+            box = Label(text=f"[b]{ev.display_title}[/b] | {ev.organizer}", markup=True, halign='left', valign='top', color=self.event_text_color)
             box.size_hint = (None, None)
             box.text_size = (w - dp(4), h - dp(4))
             box.size = (w, h)
@@ -165,8 +161,10 @@ class DayScheduleModal(ModalView):
         )
         root.add_widget(header)
 
-        sc = ScrollView(size_hint=(1, 1))
         timeline = DayScheduleView(events, day_date)
+        root.add_widget(EventSearchBar(timeline.set_filter, day=day_date))
+
+        sc = ScrollView(size_hint=(1, 1))
         sc.add_widget(timeline)
         root.add_widget(sc)
         self.add_widget(root)